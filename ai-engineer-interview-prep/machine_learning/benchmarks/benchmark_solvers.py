@@ -0,0 +1,332 @@
+"""
+Solver Benchmark Suite
+========================
+Which solver should I use for THIS workload? Measure, don't guess.
+
+Every solver in the repo is run on the same synthetic data with a KNOWN
+answer, across a grid of:
+  - n (rows), p (features), dtype, and BLAS thread count
+
+and we record:
+  - wall time, peak RSS (resident memory)
+  - iterations to convergence (where the solver has a notion of it)
+  - max |β - β_true| against the ground truth (intercept 3, slopes 2)
+
+Each case runs in its OWN subprocess. That gives an honest peak-RSS number
+per case and lets us pin the BLAS thread count via environment variables
+(BLAS reads them once, when NumPy is first imported).
+
+Usage:
+    python benchmark_solvers.py                              # quick default grid
+    python benchmark_solvers.py --n 1e3 1e5 1e7 --p 1 10 100 \\
+        --dtype float64 float32 --threads 1 4 --out results
+    python benchmark_solvers.py --list                       # show solver names
+
+Results are written to <out>.json and <out>.csv.
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import itertools
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ML_ROOT = Path(__file__).resolve().parents[1]
+LINEAR_DIR = ML_ROOT / "regression" / "linear_regression"
+LOGISTIC_DIR = ML_ROOT / "classification" / "logistic_regression"
+OPTIMIZATION_DIR = ML_ROOT / "optimization"
+
+TRUE_INTERCEPT = 3.0
+TRUE_SLOPE = 2.0
+
+
+# ---------------------------------------------------------------------------
+# Loading the solvers
+# ---------------------------------------------------------------------------
+# The example_numpy.py files are teaching scripts: importing them runs the
+# demo. runpy.run_path gives us their functions; we just swallow the prints.
+
+_script_cache = {}
+
+
+def _load_script(path):
+    if path not in _script_cache:
+        with contextlib.redirect_stdout(io.StringIO()):
+            import runpy
+            _script_cache[path] = runpy.run_path(str(path))
+    return _script_cache[path]
+
+
+def _add_intercept(X_raw):
+    return np.column_stack([np.ones(X_raw.shape[0], dtype=X_raw.dtype), X_raw])
+
+
+# ---------------------------------------------------------------------------
+# The solver registry
+# ---------------------------------------------------------------------------
+# Each entry: name -> (model, run_fn). run_fn(X_raw, y, max_iter) returns
+# (beta_with_intercept_first, iterations_or_None).
+
+def _linear_normal_equation(X_raw, y, max_iter):
+    fn = _load_script(LINEAR_DIR / "example_numpy.py")["normal_equation"]
+    return fn(_add_intercept(X_raw), y), None
+
+
+def _linear_streaming(X_raw, y, max_iter):
+    mod = _load_script(LINEAR_DIR / "streaming_normal_equation.py")
+    blocks = mod["iter_array_blocks"](X_raw, y, chunk_rows=100_000)
+    return mod["streaming_normal_equation"](blocks), None
+
+
+def _linear_gradient_descent(X_raw, y, max_iter):
+    fn = _load_script(LINEAR_DIR / "example_numpy.py")["gradient_descent"]
+    # No callback: attaching one turns on the per-iteration loss inside the
+    # timed loop. The iteration count comes from the convergence message.
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        beta = fn(_add_intercept(X_raw), y, learning_rate=0.1, n_iterations=max_iter)
+    converged = re.search(r"Converged at iteration (\d+)", log.getvalue())
+    return beta, int(converged.group(1)) + 1 if converged else max_iter
+
+
+def _linear_sgd(X_raw, y, max_iter):
+    mod = _load_script(OPTIMIZATION_DIR / "sgd_engine.py")
+    batch_size = 512
+    beta, _ = mod["sgd"](
+        lambda: mod["iter_minibatches"](X_raw, y, batch_size=batch_size, rng=np.random.default_rng(0)),
+        mod["linear_batch_gradient"], epochs=1,
+    )
+    return beta, -(-len(y) // batch_size)
+
+
+def _linear_sklearn(X_raw, y, max_iter):
+    from sklearn.linear_model import LinearRegression
+    model = LinearRegression().fit(X_raw, y)
+    return np.concatenate([[model.intercept_], model.coef_]), None
+
+
+def _logistic_gradient_descent(X_raw, y, max_iter):
+    fn = _load_script(LOGISTIC_DIR / "example_numpy.py")["train_logistic_regression"]
+    with contextlib.redirect_stdout(io.StringIO()):
+        beta, _ = fn(_add_intercept(X_raw), y, learning_rate=0.5, n_iterations=max_iter)
+    return beta, max_iter
+
+
+def _logistic_fused(X_raw, y, max_iter):
+    fn = _load_script(LOGISTIC_DIR / "fused_kernel.py")["train_logistic_regression_fused"]
+    beta, _ = fn(_add_intercept(X_raw), y, learning_rate=0.5, n_iterations=max_iter, loss_every=0)
+    return beta, max_iter
+
+
+def _logistic_newton(X_raw, y, max_iter):
+    fn = _load_script(LOGISTIC_DIR / "newton_solver.py")["train_newton"]
+    beta, losses = fn(_add_intercept(X_raw), y, max_iter=max_iter)
+    return beta, len(losses) - 1
+
+
+def _logistic_lbfgs(X_raw, y, max_iter):
+    fn = _load_script(LOGISTIC_DIR / "newton_solver.py")["train_lbfgs"]
+    beta, losses = fn(_add_intercept(X_raw), y, max_iter=max_iter)
+    return beta, len(losses) - 1
+
+
+def _logistic_sgd(X_raw, y, max_iter):
+    mod = _load_script(OPTIMIZATION_DIR / "sgd_engine.py")
+    batch_size = 512
+    beta, _ = mod["sgd"](
+        lambda: mod["iter_minibatches"](X_raw, y, batch_size=batch_size, rng=np.random.default_rng(0)),
+        mod["logistic_batch_gradient"], epochs=1, schedule=mod["inverse_time_lr"](0.5),
+    )
+    return beta, -(-len(y) // batch_size)
+
+
+def _logistic_sklearn(X_raw, y, max_iter):
+    from sklearn.linear_model import LogisticRegression
+    # C=inf → no penalty, so the answer is comparable with the ground truth
+    model = LogisticRegression(C=np.inf, max_iter=max_iter).fit(X_raw, y)
+    return np.concatenate([model.intercept_, model.coef_[0]]), int(model.n_iter_[0])
+
+
+SOLVERS = {
+    "linear/normal_equation": ("linear", _linear_normal_equation),
+    "linear/streaming_normal_equation": ("linear", _linear_streaming),
+    "linear/gradient_descent": ("linear", _linear_gradient_descent),
+    "linear/sgd": ("linear", _linear_sgd),
+    "linear/sklearn": ("linear", _linear_sklearn),
+    "logistic/gradient_descent": ("logistic", _logistic_gradient_descent),
+    "logistic/fused_kernel": ("logistic", _logistic_fused),
+    "logistic/newton": ("logistic", _logistic_newton),
+    "logistic/lbfgs": ("logistic", _logistic_lbfgs),
+    "logistic/sgd": ("logistic", _logistic_sgd),
+    "logistic/sklearn": ("logistic", _logistic_sklearn),
+}
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data with a known answer
+# ---------------------------------------------------------------------------
+# Features are N(0, 1/p), so the signal Σ 2·x_j has variance 4 no matter
+# how many features there are — the problem stays equally hard as p grows.
+# For p = 1 this is the same "y = 3 + 2x + noise" story as example_numpy.py.
+
+def make_data(model, n, p, dtype, seed=42):
+    rng = np.random.default_rng(seed)
+    X_raw = (rng.standard_normal((n, p)) / np.sqrt(p)).astype(dtype)
+    z = TRUE_INTERCEPT + TRUE_SLOPE * X_raw.sum(axis=1, dtype=np.float64)
+    if model == "linear":
+        y = z + 0.5 * rng.standard_normal(n)
+    else:
+        y = (rng.random(n) < 1.0 / (1.0 + np.exp(-z))).astype(np.float64)
+    return X_raw, y.astype(dtype)
+
+
+# ---------------------------------------------------------------------------
+# Worker: runs ONE case in a fresh process, prints one JSON line
+# ---------------------------------------------------------------------------
+
+def _peak_rss_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(case):
+    model, run_fn = SOLVERS[case["solver"]]
+
+    # Warm-up on a small problem so imports (scipy, sklearn) and script
+    # loading are not counted in the timed run. n ≥ 2p keeps XᵀX
+    # invertible, capped at ~1M cells; if a capped warm-up is singular it
+    # fails here harmlessly — the timed run is the one that counts.
+    p = case["p"]
+    n_warm = min(case["n"], max(256, min(2 * p, 1_000_000 // p)))
+    try:
+        run_fn(*make_data(model, n_warm, p, case["dtype"]), case["max_iter"])
+    except Exception:
+        pass
+
+    X_raw, y = make_data(model, case["n"], case["p"], case["dtype"])
+    rss_data_mb = _peak_rss_mb()
+
+    start = time.perf_counter()
+    beta, iterations = run_fn(X_raw, y, case["max_iter"])
+    wall = time.perf_counter() - start
+
+    beta_true = np.full(case["p"] + 1, TRUE_SLOPE)
+    beta_true[0] = TRUE_INTERCEPT
+    return {
+        **case,
+        "status": "ok",
+        "wall_time_s": wall,
+        "peak_rss_mb": _peak_rss_mb(),
+        "data_rss_mb": rss_data_mb,
+        "iterations": iterations,
+        "coef_max_abs_error": float(np.max(np.abs(np.asarray(beta, dtype=np.float64) - beta_true))),
+    }
+
+
+def _run_in_subprocess(case, timeout):
+    env = dict(os.environ)
+    if case["threads"]:
+        for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS",
+                    "VECLIB_MAXIMUM_THREADS", "NUMEXPR_NUM_THREADS"):
+            env[var] = str(case["threads"])
+    try:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--worker", json.dumps(case)],
+            capture_output=True, text=True, env=env, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {**case, "status": "timeout"}
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit {proc.returncode}"
+        return {**case, "status": "error", "error": error}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+# ---------------------------------------------------------------------------
+# Driver: build the grid, run it, write JSON + CSV
+# ---------------------------------------------------------------------------
+
+FIELDS = [
+    "solver", "n", "p", "dtype", "threads", "max_iter", "status",
+    "wall_time_s", "peak_rss_mb", "data_rss_mb", "iterations", "coef_max_abs_error", "error",
+]
+
+
+def write_results(results, out_prefix):
+    out_prefix = Path(out_prefix)
+    out_prefix.parent.mkdir(parents=True, exist_ok=True)
+    # Append the extension: with_suffix would turn "results.v2" into "results.json"
+    with open(f"{out_prefix}.json", "w") as f:
+        json.dump(results, f, indent=2)
+    with open(f"{out_prefix}.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--n", type=float, nargs="+", default=[1e3, 1e4, 1e5])
+    parser.add_argument("--p", type=float, nargs="+", default=[1, 10])
+    parser.add_argument("--dtype", nargs="+", default=["float64"], choices=["float64", "float32"])
+    parser.add_argument("--threads", type=int, nargs="+", default=[0],
+                        help="BLAS threads per case (0 = library default)")
+    parser.add_argument("--solvers", nargs="+", default=list(SOLVERS),
+                        help="solver names or prefixes, e.g. 'linear/' (see --list)")
+    parser.add_argument("--max-iter", type=int, default=1000)
+    parser.add_argument("--max-gb", type=float, default=4.0,
+                        help="skip cases whose X would exceed this many GB")
+    parser.add_argument("--timeout", type=float, default=600.0, help="seconds per case")
+    parser.add_argument("--out", default="benchmark_results")
+    parser.add_argument("--list", action="store_true", help="list solver names and exit")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_case(json.loads(args.worker))))
+        return 0
+    if args.list:
+        print("\n".join(SOLVERS))
+        return 0
+
+    solvers = [name for name in SOLVERS if any(name.startswith(s) for s in args.solvers)]
+    results = []
+    for solver, n, p, dtype, threads in itertools.product(
+        solvers, args.n, args.p, args.dtype, args.threads
+    ):
+        case = {"solver": solver, "n": int(n), "p": int(p), "dtype": dtype,
+                "threads": threads, "max_iter": args.max_iter}
+        itemsize = 4 if dtype == "float32" else 8
+        if case["n"] * case["p"] * itemsize > args.max_gb * 1e9:
+            result = {**case, "status": "skipped", "error": "exceeds --max-gb"}
+        else:
+            result = _run_in_subprocess(case, args.timeout)
+        results.append(result)
+
+        if result["status"] == "ok":
+            print(f"{solver:>34s} n={case['n']:<10,d} p={case['p']:<6d} {dtype:<8s} "
+                  f"t={threads or '-':<3} | {result['wall_time_s']:8.3f}s "
+                  f"| {result['peak_rss_mb']:8.1f} MB | iters={result['iterations'] or '-':<5} "
+                  f"| err={result['coef_max_abs_error']:.2e}")
+        else:
+            print(f"{solver:>34s} n={case['n']:<10,d} p={case['p']:<6d} {dtype:<8s} "
+                  f"t={threads or '-':<3} | {result['status']}: {result.get('error', '')}")
+
+    write_results(results, args.out)
+    print(f"\nWrote {len(results)} results to {args.out}.json and {args.out}.csv")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,8 @@ This implements binary logistic regression step by step.
 Read the comments — they explain WHY, not just WHAT.
 """
 
+import time
+
 import numpy as np
 
 # ---------------------------------------------------------------------------
@@ -77,14 +79,23 @@ def compute_loss(y, p):
 # ((1/n) * Xᵀ(Xβ - y)) except Xβ is replaced by σ(Xβ).
 # Beautiful, right?
 
-def train_logistic_regression(X, y, learning_rate=0.1, n_iterations=1000):
-    """Train logistic regression using batch gradient descent."""
+def train_logistic_regression(X, y, learning_rate=0.1, n_iterations=1000, callback=None):
+    """
+    Train logistic regression using batch gradient descent.
+
+    callback: optional function called once per iteration with a dict of
+    {iteration, loss, gradient_norm, step_size, seconds, rows_per_sec}.
+    See optimization/instrumentation.py for ready-made sinks.
+    """
     n, p = X.shape
     beta = np.zeros(p)  # Start with all zeros
 
     losses = []  # Track loss over time (should decrease!)
 
     for i in range(n_iterations):
+        if callback is not None:
+            start_ns = time.perf_counter_ns()
+
         # Forward pass: compute predictions
         z = X @ beta              # Linear score
         p = sigmoid(z)            # Probability via sigmoid
@@ -100,6 +111,18 @@ def train_logistic_regression(X, y, learning_rate=0.1, n_iterations=1000):
         # Update weights (step downhill)
         beta = beta - learning_rate * gradient
 
+        # Report progress (only costs anything when a callback is attached)
+        if callback is not None:
+            seconds = (time.perf_counter_ns() - start_ns) * 1e-9
+            callback({
+                "iteration": i,
+                "loss": loss,
+                "gradient_norm": np.linalg.norm(gradient),
+                "step_size": learning_rate,
+                "seconds": seconds,
+                "rows_per_sec": n / seconds if seconds > 0 else float("inf"),
+            })
+
         # Print progress every 200 iterations
         if i % 200 == 0:
             accuracy = np.mean((p >= 0.5) == y)
@@ -0,0 +1,192 @@
+"""
+Multinomial (Softmax) Logistic Regression, Vectorized (NumPy only)
+====================================================================
+05_multiclass_and_extensions.md covers the math. This is the engineering:
+K classes, ONE model, ONE pass over X per iteration.
+
+One-vs-rest with example_numpy.py = K binary trainers = K passes over X
+per step. Softmax keeps all K weight vectors as the columns of a p x K
+matrix W, so the whole step is two matrix-matrix products:
+
+    Z = X W                    (n x K logits — one GEMM)
+    P = softmax(Z)             (row-wise)
+    ∇ = (1/n) Xᵀ(P - Y)        (p x K gradient — one GEMM)
+
+GEMM (matrix x matrix) reads X once for all K columns. For K = 100 that's
+one pass where one-vs-rest makes 100.
+
+Three details that matter:
+  1. Stable log-sum-exp: subtract each row's max before exp. Softmax is
+     unchanged, and e^(...) can no longer overflow.
+  2. Integer labels, not one-hot: P - Y only differs from P at ONE entry
+     per row, so subtract 1 at P[i, y_i]. No n x K one-hot matrix.
+  3. Fused and in place: logits, exp, normalization and P - Y all reuse
+     ONE n x K buffer (like fused_kernel.py does for the binary case).
+"""
+
+import numpy as np
+
+
+class SoftmaxWorkspace:
+    """Preallocated buffers: one n x K block, two n-vectors, one p x K gradient."""
+
+    def __init__(self, n, p, n_classes):
+        self.Z = np.empty((n, n_classes))
+        self.row_max = np.empty(n)
+        self.row_sum = np.empty(n)
+        self.rows = np.arange(n)
+        self.gradient = np.empty((p, n_classes))
+
+
+def softmax_loss_and_gradient(W, X, y, ws, l2=0.0, compute_loss=True):
+    """
+    Fill ws.gradient with the gradient of
+        mean cross-entropy + (l2/2)·||W[1:]||²    (row 0 = intercepts, unpenalized)
+    and return the loss (None if compute_loss is False).
+
+    X includes the column of ones FIRST; y holds integer labels 0..K-1.
+    """
+    n = X.shape[0]
+    Z, rows = ws.Z, ws.rows
+
+    np.matmul(X, W, out=Z)                                  # logits, one GEMM
+
+    # Stable log-sum-exp: shift each row so its max is 0
+    np.max(Z, axis=1, out=ws.row_max)
+    Z -= ws.row_max[:, None]
+
+    loss = None
+    if compute_loss:
+        true_logit_sum = Z[rows, y].sum()                   # shifted logit of each row's class
+    np.exp(Z, out=Z)
+    np.sum(Z, axis=1, out=ws.row_sum)
+    if compute_loss:
+        # -log softmax(z)_y = log Σ_k e^(z_k - m) - (z_y - m)
+        loss = (np.log(ws.row_sum).sum() - true_logit_sum) / n
+        if l2:
+            loss += 0.5 * l2 * np.sum(W[1:] ** 2)
+
+    Z /= ws.row_sum[:, None]                                # Z is now P
+    Z[rows, y] -= 1.0                                       # P - Y, without building Y
+
+    np.matmul(X.T, Z, out=ws.gradient)                      # one GEMM for all K classes
+    ws.gradient *= 1.0 / n
+    if l2:
+        ws.gradient[1:] += l2 * W[1:]
+    return loss
+
+
+def train_softmax_regression(X, y, n_classes=None, learning_rate=0.5, n_iterations=1000, l2=0.0, loss_every=1):
+    """
+    Batch gradient descent on the softmax cross-entropy.
+
+    X includes the column of ones FIRST (as in example_numpy.py).
+    y: integer class labels 0..K-1.
+    Returns (W, losses): W is p x K, losses as in fused_kernel.py
+    (one entry per evaluated iteration 0, k, 2k, ...).
+    """
+    y = np.asarray(y)
+    if not np.issubdtype(y.dtype, np.integer):
+        raise ValueError("y must hold integer class labels 0..K-1 (not one-hot, not floats)")
+    n, p = X.shape
+    n_classes = n_classes or int(y.max()) + 1
+    W = np.zeros((p, n_classes))
+    ws = SoftmaxWorkspace(n, p, n_classes)
+
+    n_logged = 0 if loss_every == 0 else (n_iterations + loss_every - 1) // loss_every
+    losses = np.empty(n_logged)
+
+    for i in range(n_iterations):
+        log_now = loss_every and i % loss_every == 0
+        loss = softmax_loss_and_gradient(W, X, y, ws, l2=l2, compute_loss=log_now)
+        if log_now:
+            losses[i // loss_every] = loss
+        ws.gradient *= learning_rate
+        W -= ws.gradient
+
+    return W, losses
+
+
+def predict_proba(X, W):
+    """Class probabilities, n x K (rows sum to 1)."""
+    Z = X @ W
+    Z -= Z.max(axis=1, keepdims=True)
+    np.exp(Z, out=Z)
+    Z /= Z.sum(axis=1, keepdims=True)
+    return Z
+
+
+def predict(X, W):
+    """Most likely class — argmax of the logits, no softmax needed."""
+    return np.argmax(X @ W, axis=1)
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import runpy
+    import time
+    from pathlib import Path
+
+    # -----------------------------------------------------------------------
+    # 1) Correctness: same optimum as sklearn's multinomial LogisticRegression
+    # -----------------------------------------------------------------------
+    from scipy.optimize import minimize
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import log_loss
+
+    rng = np.random.default_rng(42)
+    n, d, K = 3_000, 5, 4
+    centers = 2 * rng.standard_normal((K, d))
+    y = rng.integers(0, K, n)
+    X_raw = centers[y] + rng.standard_normal((n, d))
+    X = np.column_stack([np.ones(n), X_raw])
+
+    # The fused kernel, driven by L-BFGS to full convergence, vs sklearn
+    C = 1.0
+    ws = SoftmaxWorkspace(n, X.shape[1], K)
+
+    def objective(w_flat):
+        loss = softmax_loss_and_gradient(w_flat.reshape(-1, K), X, y, ws, l2=1.0 / (C * n))
+        return loss, ws.gradient.ravel().copy()
+
+    W_opt = minimize(objective, np.zeros(X.shape[1] * K), jac=True, method="L-BFGS-B",
+                     options={"gtol": 1e-10, "ftol": 1e-15, "maxiter": 10_000}).x.reshape(-1, K)
+    sk = LogisticRegression(C=C, tol=1e-12, max_iter=10_000).fit(X_raw, y)   # lbfgs = multinomial
+
+    # The trainer itself: plain batch GD
+    W, losses = train_softmax_regression(X, y, learning_rate=1.0, n_iterations=2_000, l2=1.0 / (C * n), loss_every=500)
+
+    # Softmax is shift-invariant across classes, so compare probabilities
+    print(f"=== Softmax vs sklearn (n={n:,}, K={K}) ===")
+    print(f"Max |P(fused kernel + L-BFGS) - P(sklearn)|: "
+          f"{np.max(np.abs(predict_proba(X, W_opt) - sk.predict_proba(X_raw))):.2e}")
+    print(f"GD trainer, loss every 500 iterations: {np.round(losses, 5)}")
+    print(f"Train log loss: GD {log_loss(y, predict_proba(X, W)):.5f} | "
+          f"sklearn {log_loss(y, sk.predict_proba(X_raw)):.5f}")
+    print(f"Accuracy:       GD {np.mean(predict(X, W) == y):.4f} | sklearn {sk.score(X_raw, y):.4f}")
+
+    # -----------------------------------------------------------------------
+    # 2) Cost: 100 classes — one softmax step vs 100 one-vs-rest steps
+    # -----------------------------------------------------------------------
+    with contextlib.redirect_stdout(io.StringIO()):      # example_numpy runs its demo on load
+        binary = runpy.run_path(str(Path(__file__).resolve().with_name("example_numpy.py")))
+
+    n, d, K, steps = 100_000, 50, 100, 20
+    centers = rng.standard_normal((K, d))
+    y = rng.integers(0, K, n)
+    X = np.column_stack([np.ones(n), centers[y] + rng.standard_normal((n, d))])
+
+    start = time.perf_counter()
+    W, _ = train_softmax_regression(X, y, n_iterations=steps, loss_every=0)
+    t_softmax = (time.perf_counter() - start) / steps
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for k in range(K):                               # K binary problems, K passes over X
+            binary["train_logistic_regression"](X, (y == k).astype(float), 0.5, 1)
+    t_ovr = time.perf_counter() - start
+
+    print(f"\n=== One training step, n={n:,}, p={d + 1}, K={K} classes ===")
+    print(f"Softmax (2 GEMMs):            {t_softmax * 1000:8.1f} ms")
+    print(f"One-vs-rest (K binary steps): {t_ovr * 1000:8.1f} ms  ({t_ovr / t_softmax:.1f}x slower)")
@@ -0,0 +1,143 @@
+"""
+Single-Pass Streaming Classification Metrics (NumPy only)
+===========================================================
+Confusion matrix, accuracy, precision, recall, F1 — and log loss — for a
+holdout set too big to load at once.
+
+Good news: the confusion matrix is just four COUNTS. Counts add up, so:
+  - update from one chunk at a time (O(1) memory)
+  - merge results from different workers by adding their counters
+
+We use Python ints for the counts, so even a billion-row holdout set
+can't overflow.
+"""
+
+import numpy as np
+
+
+class ClassificationMetrics:
+    """
+    Mergeable accumulator for binary classification metrics.
+
+        metrics = ClassificationMetrics(threshold=0.5)
+        for y_chunk, prob_chunk in chunks:
+            metrics.update(y_chunk, prob_chunk)
+        metrics.result()
+    """
+
+    def __init__(self, threshold=0.5):
+        self.threshold = threshold
+        self.tp = self.fp = self.fn = self.tn = 0
+        self.log_loss_sum = 0.0
+
+    def update(self, y_true, probs):
+        """Fold in one chunk of true labels (0/1) and predicted P(y=1)."""
+        # Flatten first: (n, 1) probs would broadcast against (n,) labels
+        y_true = np.asarray(y_true).astype(bool).ravel()
+        probs = np.asarray(probs, dtype=np.float64).ravel()
+        if y_true.size != probs.size:
+            raise ValueError(f"y_true has {y_true.size} values, probs has {probs.size}")
+        predicted = probs >= self.threshold
+
+        # Four vectorized counts — same as the "by hand" confusion matrix
+        # in example_numpy.py, but accumulated instead of recomputed
+        n_pos = int(np.count_nonzero(y_true))
+        tp = int(np.count_nonzero(predicted & y_true))
+        n_pred_pos = int(np.count_nonzero(predicted))
+        self.tp += tp
+        self.fp += n_pred_pos - tp
+        self.fn += n_pos - tp
+        self.tn += y_true.size - n_pos - n_pred_pos + tp
+
+        # Log loss needs the probabilities too; clip like compute_loss does
+        p = np.clip(probs, 1e-15, 1 - 1e-15)
+        self.log_loss_sum -= np.sum(np.where(y_true, np.log(p), np.log1p(-p)))
+        return self
+
+    def merge(self, other):
+        """Fold `other` into self (in place). Returns self."""
+        if other.threshold != self.threshold:
+            raise ValueError(f"Cannot merge threshold {other.threshold} into {self.threshold}")
+        self.tp += other.tp
+        self.fp += other.fp
+        self.fn += other.fn
+        self.tn += other.tn
+        self.log_loss_sum += other.log_loss_sum
+        return self
+
+    @property
+    def n(self):
+        return self.tp + self.fp + self.fn + self.tn
+
+    def result(self):
+        if self.n == 0:
+            raise ValueError("No data: update() was never called with rows")
+        tp, fp, fn, tn = self.tp, self.fp, self.fn, self.tn
+        precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
+        recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
+        f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
+        return {
+            "n": self.n,
+            "tp": tp, "fp": fp, "fn": fn, "tn": tn,
+            "accuracy": (tp + tn) / self.n,
+            "precision": precision,
+            "recall": recall,
+            "f1": f1,
+            "log_loss": self.log_loss_sum / self.n,
+        }
+
+
+if __name__ == "__main__":
+    import time
+
+    # -----------------------------------------------------------------------
+    # A "huge" holdout set, scored shard by shard
+    # -----------------------------------------------------------------------
+    # Two blobs as in example_numpy.py; pretend we fitted β = [0, 2, 2].
+
+    beta = np.array([0.0, 2.0, 2.0])
+    n_chunks, chunk_rows, n_workers = 40, 250_000, 4
+
+    def holdout_chunks(worker):
+        rng = np.random.default_rng(worker)
+        for _ in range(n_chunks // n_workers):
+            y = rng.integers(0, 2, chunk_rows)
+            X_raw = rng.standard_normal((chunk_rows, 2)) + np.where(y[:, None] == 1, 1.0, -1.0)
+            probs = 1.0 / (1.0 + np.exp(-(beta[0] + X_raw @ beta[1:])))
+            yield y, probs
+
+    start = time.perf_counter()
+    total = ClassificationMetrics()
+    for worker in range(n_workers):
+        partial = ClassificationMetrics()
+        for y_chunk, prob_chunk in holdout_chunks(worker):
+            partial.update(y_chunk, prob_chunk)
+        total.merge(partial)
+    streamed = total.result()
+    elapsed = time.perf_counter() - start
+
+    print(f"=== Streaming Metrics: {streamed['n']:,} rows, {n_workers} merged shards ===")
+    print(f"              Pred 1   Pred 0")
+    print(f"  Actual 1: {streamed['tp']:8d} {streamed['fn']:8d}")
+    print(f"  Actual 0: {streamed['fp']:8d} {streamed['tn']:8d}")
+    print(f"\nAccuracy:  {streamed['accuracy']:.4f}")
+    print(f"Precision: {streamed['precision']:.4f}")
+    print(f"Recall:    {streamed['recall']:.4f}")
+    print(f"F1-score:  {streamed['f1']:.4f}")
+    print(f"Log loss:  {streamed['log_loss']:.4f}")
+    print(f"Time: {elapsed:.2f}s, memory: 4 counters + 1 float")
+
+    # -----------------------------------------------------------------------
+    # Check against the in-memory computation from example_numpy.py
+    # -----------------------------------------------------------------------
+    y_all, probs_all = map(np.concatenate, zip(*[
+        (y_c, p_c) for w in range(n_workers) for y_c, p_c in holdout_chunks(w)
+    ]))
+    predictions = (probs_all >= 0.5).astype(int)
+    exact = {
+        "tp": np.sum((predictions == 1) & (y_all == 1)),
+        "fp": np.sum((predictions == 1) & (y_all == 0)),
+        "fn": np.sum((predictions == 0) & (y_all == 1)),
+        "tn": np.sum((predictions == 0) & (y_all == 0)),
+    }
+    print(f"\nCounts match in-memory confusion matrix: {all(streamed[k] == v for k, v in exact.items())}")
@@ -0,0 +1,248 @@
+"""
+Threshold Sweeps and Streaming ROC-AUC / PR-AUC (NumPy only)
+==============================================================
+example_numpy.py evaluates ONE threshold (0.5). Tuning the threshold by
+re-running the confusion-matrix code for each candidate costs one full
+pass per threshold. Two better ways:
+
+  1. Exact sweep — sort the probabilities ONCE (O(n log n)). Walking down
+     the sorted list, every position is a threshold, and TP / FP at that
+     threshold are just cumulative sums. Precision, recall, F1, ROC-AUC and
+     PR-AUC for ALL thresholds come out of two np.cumsum calls.
+
+  2. Streaming histogram — bucket the scores into B fixed bins, counting
+     positives and negatives per bin. One pass, O(B) memory, and two
+     histograms merge by adding. ROC-AUC and PR-AUC from the histogram
+     both come with a KNOWN error bound: the only ambiguity is the order
+     of scores that land in the same bin.
+"""
+
+import numpy as np
+
+
+# ---------------------------------------------------------------------------
+# Part 1: the exact sweep — one sort, every threshold
+# ---------------------------------------------------------------------------
+
+def _curves_from_counts(tp, fp, n_pos, n_neg):
+    """Precision / recall / F1 / FPR arrays from cumulative TP and FP."""
+    tp = tp.astype(np.float64)
+    fp = fp.astype(np.float64)
+    predicted_pos = tp + fp
+    precision = np.divide(tp, predicted_pos, out=np.ones_like(tp), where=predicted_pos > 0)
+    recall = tp / n_pos if n_pos else np.zeros_like(tp)
+    fpr = fp / n_neg if n_neg else np.zeros_like(fp)
+    denom = precision + recall
+    f1 = np.divide(2 * precision * recall, denom, out=np.zeros_like(tp), where=denom > 0)
+    return precision, recall, f1, fpr
+
+
+def _auc_from_curves(tp, fp, n_pos, n_neg):
+    """ROC-AUC (trapezoid) and PR-AUC (average precision) from cumulative counts."""
+    if n_pos == 0 or n_neg == 0:
+        raise ValueError("AUC needs at least one positive and one negative example")
+    tpr = np.concatenate([[0.0], tp / n_pos])
+    fpr = np.concatenate([[0.0], fp / n_neg])
+    roc_auc = np.trapezoid(tpr, fpr) if hasattr(np, "trapezoid") else np.trapz(tpr, fpr)
+
+    # Average precision: Σ (R_k - R_{k-1}) · P_k — the step-wise PR area
+    predicted_pos = tp + fp
+    precision = np.divide(tp, predicted_pos, out=np.ones(len(tp)), where=predicted_pos > 0)
+    pr_auc = np.sum(np.diff(tpr) * precision)
+    return roc_auc, pr_auc
+
+
+def threshold_sweep(y_true, probs):
+    """
+    Metrics at EVERY distinct threshold, from one sort.
+
+    Returns a dict of arrays, one entry per distinct score (descending):
+        thresholds, tp, fp, precision, recall, f1, fpr
+    plus scalars roc_auc and pr_auc (exact).
+    "Predict 1 if prob >= thresholds[k]" gives the k-th entry.
+    """
+    y_true = np.asarray(y_true).astype(bool)
+    probs = np.asarray(probs, dtype=np.float64)
+
+    order = np.argsort(-probs, kind="stable")
+    sorted_probs = probs[order]
+    sorted_y = y_true[order]
+
+    # Cumulative counts: predicting 1 for the top k scores gives
+    # tp = positives among them, fp = k - tp
+    tp_all = np.cumsum(sorted_y)
+    fp_all = np.arange(1, len(sorted_y) + 1) - tp_all
+
+    # Tied scores can't be split by a threshold: keep the LAST index of
+    # each run of equal scores
+    last_of_run = np.r_[sorted_probs[1:] != sorted_probs[:-1], True]
+    tp, fp = tp_all[last_of_run], fp_all[last_of_run]
+    n_pos = int(tp_all[-1]) if len(tp_all) else 0
+    n_neg = len(sorted_y) - n_pos
+
+    precision, recall, f1, fpr = _curves_from_counts(tp, fp, n_pos, n_neg)
+    roc_auc, pr_auc = _auc_from_curves(tp, fp, n_pos, n_neg)
+    return {
+        "thresholds": sorted_probs[last_of_run],
+        "tp": tp, "fp": fp,
+        "precision": precision, "recall": recall, "f1": f1, "fpr": fpr,
+        "roc_auc": roc_auc, "pr_auc": pr_auc,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Part 2: the streaming histogram — one pass, O(bins) memory, mergeable
+# ---------------------------------------------------------------------------
+# Bin k covers scores in [k/B, (k+1)/B). Per bin we count positives and
+# negatives. Sweeping the bins from high to low gives TP/FP at each bin
+# edge — the same cumulative-sum trick as above, with B instead of n.
+#
+# AUC = P(score of random positive > score of random negative).
+# Pairs in DIFFERENT bins are ordered exactly. Pairs in the SAME bin are
+# unknown — counting them all as wrong / all as right gives hard lower /
+# upper bounds; we report the midpoint ± half the gap.
+#
+# PR-AUC (average precision) = mean over positives of the precision at
+# that positive's rank. Again only the order inside a bin is unknown: a
+# bin's positives score best if they all rank above its negatives, worst
+# if they all rank below. With T / F = TP / FP above the bin, a positives
+# and b negatives in it, the best case is
+#     Σ_{j=1..a} (T+j)/(T+F+j) = a - F·(H(T+F+a) - H(T+F))
+# (H = harmonic numbers), and the worst is the same with F → F + b.
+# Closed forms, so the bounds stay O(bins). As for ROC-AUC we report the
+# midpoint ± half the gap.
+
+_H_SMALL = np.concatenate([[0.0], np.cumsum(1.0 / np.arange(1, 64))])   # H(0..63), exact
+
+
+def _harmonic(m):
+    """H(m) = 1 + 1/2 + ... + 1/m: exact below 64, asymptotic series above."""
+    m = np.asarray(m, dtype=np.float64)
+    big = np.maximum(m, 64.0)
+    inv2 = 1.0 / big ** 2
+    series = np.log(big) + np.euler_gamma + 0.5 / big - inv2 * (1 / 12 - inv2 * (1 / 120 - inv2 / 252))
+    return np.where(m < 64, _H_SMALL[np.minimum(m, 63).astype(np.int64)], series)
+
+
+class ScoreHistogram:
+    """Fixed-bin score histogram for streaming, mergeable AUC and sweeps."""
+
+    def __init__(self, n_bins=1000):
+        self.n_bins = n_bins
+        self.pos = np.zeros(n_bins, dtype=np.int64)
+        self.neg = np.zeros(n_bins, dtype=np.int64)
+
+    def update(self, y_true, probs):
+        y_true = np.asarray(y_true).astype(bool)
+        probs = np.asarray(probs, dtype=np.float64)
+        bins = np.clip((probs * self.n_bins).astype(np.int64), 0, self.n_bins - 1)
+        self.pos += np.bincount(bins[y_true], minlength=self.n_bins)
+        self.neg += np.bincount(bins[~y_true], minlength=self.n_bins)
+        return self
+
+    def merge(self, other):
+        if other.n_bins != self.n_bins:
+            raise ValueError(f"Cannot merge {other.n_bins} bins into {self.n_bins}")
+        self.pos += other.pos
+        self.neg += other.neg
+        return self
+
+    def _cumulative(self):
+        # High scores first: "predict 1 if score >= lower edge of bin k"
+        tp = np.cumsum(self.pos[::-1])
+        fp = np.cumsum(self.neg[::-1])
+        return tp, fp, int(tp[-1]), int(fp[-1])
+
+    def roc_auc(self):
+        """Returns (auc_estimate, max_abs_error)."""
+        n_pos, n_neg = int(self.pos.sum()), int(self.neg.sum())
+        if n_pos == 0 or n_neg == 0:
+            raise ValueError("AUC needs at least one positive and one negative example")
+        # Negatives strictly below each bin, per positive in that bin
+        neg_below = np.cumsum(self.neg) - self.neg
+        correct = np.sum(self.pos * neg_below.astype(np.float64))
+        tied = np.sum(self.pos * self.neg.astype(np.float64))
+        total = float(n_pos) * n_neg
+        return (correct + 0.5 * tied) / total, 0.5 * tied / total
+
+    def pr_auc(self):
+        """Returns (average_precision_estimate, max_abs_error), like roc_auc."""
+        tp, fp, n_pos, n_neg = self._cumulative()
+        if n_pos == 0:
+            raise ValueError("PR-AUC needs at least one positive example")
+
+        # Counts above each bin (bins in descending-score order, as tp / fp)
+        a = self.pos[::-1].astype(np.float64)
+        b = self.neg[::-1].astype(np.float64)
+        above_tp, above_fp = tp - a, fp - b
+        above = above_tp + above_fp
+        best = np.sum(a - above_fp * (_harmonic(above + a) - _harmonic(above))) / n_pos
+        worst = np.sum(a - (above_fp + b) * (_harmonic(above + b + a) - _harmonic(above + b))) / n_pos
+        return 0.5 * (best + worst), 0.5 * (best - worst)
+
+    def sweep(self):
+        """Precision / recall / F1 at every bin edge (descending threshold)."""
+        tp, fp, n_pos, n_neg = self._cumulative()
+        precision, recall, f1, fpr = _curves_from_counts(tp, fp, n_pos, n_neg)
+        thresholds = np.arange(self.n_bins - 1, -1, -1) / self.n_bins
+        return {
+            "thresholds": thresholds, "tp": tp, "fp": fp,
+            "precision": precision, "recall": recall, "f1": f1, "fpr": fpr,
+        }
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(42)
+
+    # -----------------------------------------------------------------------
+    # Scores from the same two-blob problem as example_numpy.py, at scale
+    # -----------------------------------------------------------------------
+    n = 2_000_000
+    y = rng.integers(0, 2, n)
+    X_raw = rng.standard_normal((n, 2)) + np.where(y[:, None] == 1, 1.0, -1.0)
+    probs = 1.0 / (1.0 + np.exp(-(X_raw @ np.array([2.0, 2.0]))))
+
+    # -----------------------------------------------------------------------
+    # Exact sweep: one sort, every threshold
+    # -----------------------------------------------------------------------
+    start = time.perf_counter()
+    sweep = threshold_sweep(y, probs)
+    t_sweep = time.perf_counter() - start
+
+    best = np.argmax(sweep["f1"])
+    at_half = np.searchsorted(-sweep["thresholds"], -0.5, side="right") - 1
+
+    print(f"=== Exact Threshold Sweep (n = {n:,}) ===")
+    print(f"Distinct thresholds: {len(sweep['thresholds']):,} in {t_sweep:.2f}s")
+    print(f"ROC-AUC: {sweep['roc_auc']:.6f} | PR-AUC: {sweep['pr_auc']:.6f}")
+    print(f"At threshold 0.5:      P={sweep['precision'][at_half]:.4f} "
+          f"R={sweep['recall'][at_half]:.4f} F1={sweep['f1'][at_half]:.4f}")
+    print(f"Best F1 at {sweep['thresholds'][best]:.4f}: P={sweep['precision'][best]:.4f} "
+          f"R={sweep['recall'][best]:.4f} F1={sweep['f1'][best]:.4f}")
+
+    # -----------------------------------------------------------------------
+    # Streaming histogram: 4 shards, merged
+    # -----------------------------------------------------------------------
+    start = time.perf_counter()
+    hist = ScoreHistogram(n_bins=1000)
+    for shard in np.array_split(np.arange(n), 4):
+        hist.merge(ScoreHistogram(n_bins=1000).update(y[shard], probs[shard]))
+    auc, auc_err = hist.roc_auc()
+    t_hist = time.perf_counter() - start
+
+    print(f"\n=== Streaming Histogram (1000 bins, 4 merged shards) ===")
+    print(f"ROC-AUC: {auc:.6f} ± {auc_err:.6f}  (exact: {sweep['roc_auc']:.6f})")
+    ap, ap_err = hist.pr_auc()
+    print(f"PR-AUC:  {ap:.6f} ± {ap_err:.6f}  (exact: {sweep['pr_auc']:.6f})")
+    print(f"Time: {t_hist:.2f}s | memory: 2 x 1000 counters")
+
+    try:
+        from sklearn.metrics import average_precision_score, roc_auc_score
+    except ImportError:
+        pass
+    else:
+        print("\n=== sklearn, for reference ===")
+        print(f"roc_auc_score:           {roc_auc_score(y, probs):.6f}")
+        print(f"average_precision_score: {average_precision_score(y, probs):.6f}")
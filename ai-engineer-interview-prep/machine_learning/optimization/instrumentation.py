@@ -0,0 +1,269 @@
+"""
+Training-Loop Instrumentation (standard library + NumPy)
+==========================================================
+"Why is training slow?" and "Is it even converging?" — without adding
+print statements to the loop.
+
+Both example_numpy.py training loops take an optional `callback`. Once
+per iteration it receives a dict:
+
+    {"iteration", "loss", "gradient_norm", "step_size", "seconds", "rows_per_sec"}
+
+With callback=None the loops skip ALL of this (one `is not None` check per
+iteration), so instrumentation costs nothing unless you turn it on.
+
+Ready-made sinks:
+  1. RingBuffer  — keep the last N records in memory (bounded)
+  2. CSVSink     — stream every record to a CSV file
+  3. Every(k, sink) / fan_out(...) — thin out or combine sinks
+
+And for finding hot paths:
+  4. SectionTimer     — perf_counter_ns timer for named code sections
+  5. profile_sections — run a REAL training loop and split each iteration
+                        into forward matmul / gradient matmul / the rest,
+                        timed from the outside (the loop is not modified)
+  6. profile_call     — run anything under cProfile, get the top functions
+"""
+
+import collections
+import contextlib
+import cProfile
+import csv
+import io
+import pstats
+import time
+
+import numpy as np
+
+FIELDS = ["iteration", "loss", "gradient_norm", "step_size", "seconds", "rows_per_sec"]
+
+
+# ---------------------------------------------------------------------------
+# Sinks: things you pass as `callback=`
+# ---------------------------------------------------------------------------
+
+class RingBuffer:
+    """Keep the most recent `capacity` records. Memory never grows."""
+
+    def __init__(self, capacity=1000):
+        self.records = collections.deque(maxlen=capacity)
+
+    def __call__(self, record):
+        self.records.append(record)
+
+    def column(self, name):
+        """One field across all buffered records, as an array."""
+        return np.array([record[name] for record in self.records])
+
+
+class CSVSink:
+    """Append one CSV row per iteration. Use as a context manager."""
+
+    def __init__(self, path, flush_every=100):
+        self._file = open(path, "w", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=FIELDS, extrasaction="ignore")
+        self._writer.writeheader()
+        self._flush_every = flush_every
+        self._count = 0
+
+    def __call__(self, record):
+        self._writer.writerow(record)
+        self._count += 1
+        if self._count % self._flush_every == 0:
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class Every:
+    """Forward only every k-th iteration to `sink` (e.g. log every 100)."""
+
+    def __init__(self, k, sink):
+        self.k = k
+        self.sink = sink
+
+    def __call__(self, record):
+        if record["iteration"] % self.k == 0:
+            self.sink(record)
+
+
+def fan_out(*sinks):
+    """Send each record to several sinks."""
+    def callback(record):
+        for sink in sinks:
+            sink(record)
+    return callback
+
+
+# ---------------------------------------------------------------------------
+# Section timing
+# ---------------------------------------------------------------------------
+# time.perf_counter_ns is the highest-resolution clock Python has and
+# returns an int, so accumulating millions of samples loses no precision.
+
+class SectionTimer:
+    """
+    Accumulate wall time per named section:
+
+        timer = SectionTimer()
+        with timer("forward"):
+            z = X @ beta
+        timer.report()
+    """
+
+    def __init__(self):
+        self.total_ns = collections.defaultdict(int)
+        self.calls = collections.defaultdict(int)
+
+    @contextlib.contextmanager
+    def __call__(self, name):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter_ns() - start)
+
+    def add(self, name, elapsed_ns):
+        """Record a duration measured somewhere else (e.g. by the loop itself)."""
+        self.total_ns[name] += elapsed_ns
+        self.calls[name] += 1
+
+    def report(self):
+        grand_total = sum(self.total_ns.values()) or 1
+        lines = [f"{'Section':>10s} | {'Calls':>6s} | {'Mean':>10s} | {'Share':>6s}"]
+        for name, total in sorted(self.total_ns.items(), key=lambda kv: -kv[1]):
+            mean_us = total / self.calls[name] / 1000
+            lines.append(f"{name:>10s} | {self.calls[name]:6d} | {mean_us:8.1f}µs | {total / grand_total:6.1%}")
+        return "\n".join(lines)
+
+
+class _TimedMatrix(np.ndarray):
+    """
+    A view of X that times its own matmuls. Both training loops spend their
+    FLOPs in exactly two products: X @ β (forward) and X.T @ r (gradient).
+    """
+
+    def __array_finalize__(self, obj):
+        self._timer = getattr(obj, "_timer", None)
+        self._section = getattr(obj, "_section", "forward")
+
+    @property
+    def T(self):
+        view = super().T
+        view._section = "gradient"
+        return view
+
+    def __matmul__(self, other):
+        with self._timer(self._section):
+            return np.asarray(self) @ other
+
+
+def profile_sections(train_fn, X, y, *args, callback=None, **kwargs):
+    """
+    Run train_fn(X, y, *args, **kwargs) — the real loop, unchanged — and
+    split its iterations into sections. The matmuls are timed by handing the
+    loop a _TimedMatrix view of X; "other" is the rest of each iteration
+    (sigmoid, loss, residuals, update), i.e. the loop's own per-iteration
+    `seconds` minus the two matmuls. Returns (result, SectionTimer).
+    """
+    timer = SectionTimer()
+    X_timed = np.asarray(X).view(_TimedMatrix)
+    X_timed._timer = timer
+    matmul_ns = 0
+
+    def split(record):
+        nonlocal matmul_ns
+        now = timer.total_ns["forward"] + timer.total_ns["gradient"]
+        timer.add("other", max(0, round(record["seconds"] * 1e9) - (now - matmul_ns)))
+        matmul_ns = now
+        if callback is not None:
+            callback(record)
+
+    result = train_fn(X_timed, y, *args, callback=split, **kwargs)
+    return result, timer
+
+
+def profile_call(fn, *args, top=10, **kwargs):
+    """Run fn(*args, **kwargs) under cProfile. Returns (result, report_text)."""
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn, *args, **kwargs)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(top)
+    return result, out.getvalue()
+
+
+if __name__ == "__main__":
+    import os
+    import runpy
+    import tempfile
+    from pathlib import Path
+
+    ml_root = Path(__file__).resolve().parents[1]
+
+    # The example scripts run a demo on load — load them quietly
+    with contextlib.redirect_stdout(io.StringIO()):
+        linear = runpy.run_path(str(ml_root / "regression" / "linear_regression" / "example_numpy.py"))
+        logistic = runpy.run_path(str(ml_root / "classification" / "logistic_regression" / "example_numpy.py"))
+
+    # -----------------------------------------------------------------------
+    # Ring buffer + CSV on the linear regression loop
+    # -----------------------------------------------------------------------
+    ring = RingBuffer(capacity=5)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "trace.csv")
+        with CSVSink(csv_path) as csv_sink, contextlib.redirect_stdout(io.StringIO()):
+            linear["gradient_descent"](linear["X"], linear["y"], callback=fan_out(ring, csv_sink))
+        with open(csv_path) as f:
+            n_rows = sum(1 for _ in f) - 1
+
+    print("=== Linear GD: last 5 iterations (ring buffer) ===")
+    for r in ring.records:
+        print(f"  iter {r['iteration']:4d} | loss {r['loss']:.6f} | ‖∇‖ {r['gradient_norm']:.2e} "
+              f"| {r['seconds'] * 1e6:6.1f}µs | {r['rows_per_sec']:,.0f} rows/s")
+    print(f"CSV sink wrote {n_rows} rows")
+
+    # -----------------------------------------------------------------------
+    # Overhead check: callback=None vs a callback attached
+    # -----------------------------------------------------------------------
+    def timed(**kwargs):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            logistic["train_logistic_regression"](logistic["X"], logistic["y"], 0.5, 1000, **kwargs)
+        return time.perf_counter() - start
+
+    t_off = min(timed() for _ in range(3))
+    t_on = min(timed(callback=RingBuffer(100)) for _ in range(3))
+    print("\n=== Logistic GD: instrumentation overhead (1000 iterations) ===")
+    print(f"callback=None: {t_off * 1000:.1f} ms | with RingBuffer: {t_on * 1000:.1f} ms")
+
+    # -----------------------------------------------------------------------
+    # Where does a logistic training step spend its time?
+    # -----------------------------------------------------------------------
+    rng = np.random.default_rng(0)
+    X_big = np.column_stack([np.ones(500_000), rng.standard_normal((500_000, 5))])
+    y_big = (rng.random(500_000) < 0.5).astype(float)
+
+    print("\n=== Sections: train_logistic_regression, 20 iterations, n = 500,000 ===")
+    with contextlib.redirect_stdout(io.StringIO()):
+        (beta_timed, _), timer = profile_sections(logistic["train_logistic_regression"], X_big, y_big, 0.5, 20)
+        beta_plain, _ = logistic["train_logistic_regression"](X_big, y_big, 0.5, 20)
+    print(timer.report())
+    print(f"Same β as an untimed run: {np.array_equal(beta_timed, beta_plain)}")
+
+    print("\n=== Sections: gradient_descent, 20 iterations, n = 500,000 ===")
+    y_lin = X_big @ np.arange(6.0) + rng.standard_normal(500_000)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, timer = profile_sections(linear["gradient_descent"], X_big, y_lin, n_iterations=20)
+    print(timer.report())
+
+    print("\n=== cProfile: train_logistic_regression, 20 iterations ===")
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, report = profile_call(logistic["train_logistic_regression"], X_big, y_big, 0.5, 20, top=5)
+    print(report.strip())
@@ -0,0 +1,204 @@
+"""
+float32 Storage, float64 Accumulation: Mixed-Precision Training (NumPy + SciPy)
+===============================================================================
+Every array in the example_numpy.py files is float64: 8 bytes per number.
+Batch GD and the Normal Equation are MEMORY-BOUND — each step streams all
+of X through the CPU and does ~2 flops per number loaded. Half the bytes
+= roughly half the time, and twice the rows fit in RAM.
+
+But naive float32 everywhere breaks accuracy. float32 keeps ~7 digits,
+and long sums lose them: adding 10 million terms one at a time in float32
+leaves an error around √n·10⁻⁷ relative — and near the optimum the
+gradient is a sum of large terms that almost cancel.
+
+The mixed-precision recipe:
+  - STORE X and y in float32 (the big arrays: n x p and n)
+  - MULTIPLY in float32, one cache-sized chunk of rows at a time
+  - ACCUMULATE every chunk's partial sum (gradient, loss) in float64 —
+    so float32 only ever sums chunk_rows terms, never n
+  - KEEP β, the Gram matrix and the solve in float64 (they're tiny);
+    XᵀX is built from chunks upcast in cache (see gram_mixed)
+
+Chunking has a second payoff: Xβ and Xᵀr are computed from the SAME chunk
+while it sits in cache, so each iteration reads X from memory once, not
+twice.
+
+Accuracy check (the demo at the bottom, run on the examples' own
+datasets and on a 5M-row version of the linear one):
+  - Normal Equation: β within ~1e-9 relative of the float64 path. That
+    is the cost of rounding the DATA to float32; the Gram adds nothing.
+    The same solve with all-float32 sums is off by ~1e-3.
+  - Gradient descent: β within ~1e-7 relative (linear and logistic).
+"""
+
+import numpy as np
+from scipy.linalg import cho_solve
+
+
+def to_compact(X, y=None, dtype=np.float32):
+    """One-time conversion of the data to the storage dtype (C-contiguous)."""
+    X = np.ascontiguousarray(X, dtype=dtype)
+    return X if y is None else (X, np.ascontiguousarray(y, dtype=dtype))
+
+
+def _chunks(n, chunk_rows):
+    return ((start, min(start + chunk_rows, n)) for start in range(0, n, chunk_rows))
+
+
+# ---------------------------------------------------------------------------
+# Normal Equation: float32 in memory, float64 Gram
+# ---------------------------------------------------------------------------
+# The solve multiplies any error in XᵀX by cond(XᵀX), so here even chunked
+# float32 sums are too coarse. Instead each chunk is upcast while it sits
+# in cache: a float32 x float32 product is EXACT in float64 (24 + 24
+# mantissa bits < 53), so the Gram carries no rounding beyond float64's.
+# Memory traffic is still float32's.
+
+def gram_mixed(X, y, chunk_rows=8192):
+    """XᵀX and Xᵀy in float64, reading X and y in their storage dtype."""
+    p = X.shape[1]
+    XtX = np.zeros((p, p))
+    Xty = np.zeros(p)
+    for start, stop in _chunks(X.shape[0], chunk_rows):
+        X_chunk = X[start:stop].astype(np.float64)       # cache-sized upcast
+        XtX += X_chunk.T @ X_chunk
+        Xty += X_chunk.T @ y[start:stop].astype(np.float64)
+    return XtX, Xty
+
+
+def normal_equation_mixed(X, y, chunk_rows=8192):
+    """β = (XᵀX)⁻¹Xᵀy with a float64 Gram and a float64 Cholesky solve."""
+    XtX, Xty = gram_mixed(X, y, chunk_rows)
+    L = np.linalg.cholesky(XtX)
+    return cho_solve((L, True), Xty)
+
+
+# ---------------------------------------------------------------------------
+# Batch gradient descent: one fused pass per iteration
+# ---------------------------------------------------------------------------
+
+def loss_and_gradient_mixed(beta, X, y, model="linear", chunk_rows=8192):
+    """
+    Loss and gradient in ONE pass over X: for each chunk, z = X_c β and
+    X_cᵀr in X's dtype, then both partial sums added in float64.
+
+    model: "linear" (MSE, as gradient_descent) or "logistic" (mean log loss,
+    as train_logistic_regression). β stays float64; a copy in X's dtype is
+    used for the products.
+    """
+    n = X.shape[0]
+    beta_c = beta.astype(X.dtype)
+    loss = 0.0
+    gradient = np.zeros(X.shape[1])
+
+    for start, stop in _chunks(n, chunk_rows):
+        X_chunk = X[start:stop]
+        z = X_chunk @ beta_c
+        if model == "linear":
+            residual = z - y[start:stop]
+            loss += float(residual @ residual)
+            residual *= 2
+        elif model == "logistic":
+            loss += float(np.sum(np.logaddexp(0, z) - y[start:stop] * z))
+            residual = 0.5 * (1 + np.tanh(0.5 * z)) - y[start:stop]
+        else:
+            raise ValueError(f"model must be 'linear' or 'logistic', got {model!r}")
+        gradient += X_chunk.T @ residual    # float32 partial → float64 running sum
+
+    return loss / n, gradient / n
+
+
+def gradient_descent_mixed(X, y, model="linear", learning_rate=0.1, n_iterations=1000, tolerance=1e-8,
+                           chunk_rows=8192):
+    """
+    Batch GD with float32 data and float64 β / gradient.
+    Same updates as the example_numpy.py loops. Returns (beta, losses).
+    """
+    beta = np.zeros(X.shape[1])
+    losses = []
+    for _ in range(n_iterations):
+        loss, gradient = loss_and_gradient_mixed(beta, X, y, model, chunk_rows)
+        losses.append(loss)
+        beta -= learning_rate * gradient
+        if np.linalg.norm(gradient) < tolerance:
+            break
+    return beta, losses
+
+
+def predict_mixed(X, beta, model="linear"):
+    """Predictions from compact X: float32 products, float64 output."""
+    z = (X @ beta.astype(X.dtype)).astype(np.float64)
+    return z if model == "linear" else 0.5 * (1 + np.tanh(0.5 * z))
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import runpy
+    import time
+    from pathlib import Path
+
+    ml_root = Path(__file__).resolve().parents[1]
+    with contextlib.redirect_stdout(io.StringIO()):   # the examples run a demo on load
+        linear = runpy.run_path(str(ml_root / "regression" / "linear_regression" / "example_numpy.py"))
+        logistic = runpy.run_path(str(ml_root / "classification" / "logistic_regression" / "example_numpy.py"))
+
+    def rel(a, b):
+        return np.max(np.abs(a - b)) / np.max(np.abs(b))
+
+    # -----------------------------------------------------------------------
+    # 1) Accuracy check on the examples' own datasets
+    # -----------------------------------------------------------------------
+    print("=== Accuracy: float32 storage vs the float64 examples (same data) ===")
+
+    X, y = linear["X"], linear["y"]
+    X32, y32 = to_compact(X, y)
+    beta64 = linear["normal_equation"](X, y)
+    print(f"Linear, Normal Equation:   max rel |Δβ| = {rel(normal_equation_mixed(X32, y32), beta64):.1e}")
+    with contextlib.redirect_stdout(io.StringIO()):
+        beta64 = linear["gradient_descent"](X, y, learning_rate=0.1, n_iterations=1000)
+    beta32, _ = gradient_descent_mixed(X32, y32, "linear", learning_rate=0.1, n_iterations=1000)
+    print(f"Linear, gradient descent:  max rel |Δβ| = {rel(beta32, beta64):.1e}")
+
+    X, y = logistic["X"], logistic["y"]
+    X32, y32 = to_compact(X, y)
+    with contextlib.redirect_stdout(io.StringIO()):
+        beta64, _ = logistic["train_logistic_regression"](X, y, 0.5, 1000)
+    beta32, _ = gradient_descent_mixed(X32, y32, "logistic", learning_rate=0.5, n_iterations=1000)
+    print(f"Logistic, gradient descent: max rel |Δβ| = {rel(beta32, beta64):.1e}")
+
+    # -----------------------------------------------------------------------
+    # 2) At scale: same story (y = 3 + 2·x + noise), 5M rows x 20 features
+    # -----------------------------------------------------------------------
+    rng = np.random.default_rng(42)
+    n, p = 5_000_000, 20
+    X = np.column_stack([np.ones(n), 2 * rng.random((n, p - 1))])
+    y = 3 + X[:, 1:] @ np.full(p - 1, 2.0) + 0.5 * rng.standard_normal(n)
+    X32, y32 = to_compact(X, y)
+    beta_ref = np.linalg.solve(X.T @ X, X.T @ y)
+
+    print(f"\n=== n={n:,}, p={p}: X is {X.nbytes / 1e6:,.0f} MB in float64, {X32.nbytes / 1e6:,.0f} MB in float32 ===")
+
+    beta_naive = np.linalg.solve((X32.T @ X32).astype(np.float64), (X32.T @ y32).astype(np.float64))
+    print(f"Normal Equation, all-float32 sums:     max rel |Δβ| = {rel(beta_naive, beta_ref):.1e}")
+    print(f"Normal Equation, float64 accumulation: max rel |Δβ| = {rel(normal_equation_mixed(X32, y32), beta_ref):.1e}")
+
+    def per_step(fn, repeats=5):
+        fn()                                               # warm up
+        start = time.perf_counter()
+        for _ in range(repeats):
+            fn()
+        return (time.perf_counter() - start) / repeats
+
+    beta = np.full(p, 0.1)
+
+    def step64():
+        residual = X @ beta - y
+        return (2 / n) * (X.T @ residual)
+
+    t64 = per_step(step64)
+    t32 = per_step(lambda: loss_and_gradient_mixed(beta, X32, y32))
+    g_diff = rel(loss_and_gradient_mixed(beta, X32, y32)[1], step64())
+    print(f"One GD step, float64 (example_numpy): {t64 * 1000:6.0f} ms")
+    print(f"One GD step, float32 mixed, fused:    {t32 * 1000:6.0f} ms  ({t64 / t32:.1f}x faster, "
+          f"gradient rel. diff {g_diff:.1e})")
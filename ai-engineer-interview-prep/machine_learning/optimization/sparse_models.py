@@ -0,0 +1,263 @@
+"""
+Sparse (CSR) Features: Linear and Logistic Regression Without Densifying
+==========================================================================
+One-hot and hashed features: p = 1,000,000 columns, ~50 non-zeros per row.
+As a dense float64 matrix, 10M rows would need 80 TB. As CSR (values +
+column indices + row pointers) it needs ~6 GB — memory scales with nnz.
+
+Three things in the example_numpy.py files assume dense X, and each has a
+sparse-friendly replacement:
+
+  1. np.column_stack([np.ones(n), X]) — adding a ones column to a CSR
+     matrix means rebuilding it. Instead keep the intercept SEPARATE:
+         z = X @ w + b,    ∂L/∂b = mean(residual)
+     (LSQR centers X implicitly instead, and recovers b at the end.)
+  2. normal_equation — XᵀX for p = 1e6 is a 10¹² entry matrix. Use LSQR
+     instead: an iterative least-squares solver that only needs X @ v and
+     Xᵀ @ r, both O(nnz).
+  3. Gradient steps — full-batch gradients are O(nnz) sparse matmuls.
+     Mini-batch gradients touch only the columns present in the batch,
+     so we update only those entries of w.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.optimize import minimize
+from scipy.sparse.linalg import LinearOperator, lsqr
+
+
+def _as_csr(X):
+    return X if sp.isspmatrix_csr(X) or isinstance(X, sp.csr_array) else sp.csr_matrix(X)
+
+
+def _sigmoid(z):
+    return 0.5 * (1.0 + np.tanh(0.5 * z))   # no overflow, no clipping
+
+
+# ---------------------------------------------------------------------------
+# Prediction — the implicit intercept
+# ---------------------------------------------------------------------------
+
+def predict_linear(X, coef, intercept):
+    """ŷ = Xw + b, one O(nnz) sparse mat-vec."""
+    return _as_csr(X) @ coef + intercept
+
+
+def predict_proba(X, coef, intercept):
+    """P(y=1) = σ(Xw + b)."""
+    return _sigmoid(_as_csr(X) @ coef + intercept)
+
+
+# ---------------------------------------------------------------------------
+# Linear regression: LSQR on implicitly centered X
+# ---------------------------------------------------------------------------
+# LSQR solves min ||Aw - y||² + damp²·||w||² using only A @ v and Aᵀ @ r.
+# Centering X would destroy sparsity, so A = X_c = X - 1μᵀ stays implicit:
+#   X_c @ v  = X @ v - μᵀv
+#   X_cᵀ @ r = Xᵀ r - μ·Σr
+# With y centered too, the intercept drops out of the problem and is
+# recovered exactly afterwards, b = ȳ - μᵀw — unpenalized, as in ridge_path.py.
+
+def fit_linear_lsqr(X, y, damp=0.0, tol=1e-10, max_iter=None):
+    """
+    Least squares on sparse X. damp > 0 adds a ridge penalty damp²·||w||²
+    (intercept unpenalized). Returns (coef, intercept, n_iterations).
+    """
+    X = _as_csr(X)
+    n, p = X.shape
+    XT = X.T.tocsr()   # CSR of Xᵀ makes Xᵀr a fast row-wise mat-vec
+    y = np.asarray(y, dtype=np.float64)
+    x_mean = (XT @ np.ones(n)) / n
+    y_mean = y.mean()
+
+    A = LinearOperator(
+        (n, p), dtype=np.float64,
+        matvec=lambda v: X @ v - x_mean @ v,
+        rmatvec=lambda r: XT @ r - x_mean * r.sum(),
+    )
+    coef, _, n_iter = lsqr(A, y - y_mean, damp=damp, atol=tol, btol=tol, iter_lim=max_iter)[:3]
+    return coef, y_mean - x_mean @ coef, n_iter
+
+
+# ---------------------------------------------------------------------------
+# Full-batch gradient descent — same updates as example_numpy.py
+# ---------------------------------------------------------------------------
+
+def gradient_descent_sparse(X, y, learning_rate=0.1, n_iterations=1000, tolerance=1e-8):
+    """Linear regression by batch GD; each step is two O(nnz) mat-vecs."""
+    X = _as_csr(X)
+    XT = X.T.tocsr()
+    n = X.shape[0]
+    coef, intercept = np.zeros(X.shape[1]), 0.0
+
+    for _ in range(n_iterations):
+        residuals = X @ coef + intercept - y
+        grad_coef = (2 / n) * (XT @ residuals)
+        grad_intercept = (2 / n) * residuals.sum()
+        coef -= learning_rate * grad_coef
+        intercept -= learning_rate * grad_intercept
+        if np.sqrt(grad_coef @ grad_coef + grad_intercept ** 2) < tolerance:
+            break
+
+    return coef, intercept
+
+
+def fit_logistic_lbfgs(X, y, l2=0.0, tol=1e-6, max_iter=500):
+    """
+    Logistic regression on sparse X with L-BFGS.
+    Loss: mean log loss + (l2/2)·||w||² (intercept unpenalized).
+    Returns (coef, intercept).
+    """
+    X = _as_csr(X)
+    XT = X.T.tocsr()
+    n, p = X.shape
+    y = np.asarray(y, dtype=np.float64)
+
+    def loss_and_gradient(theta):
+        b, w = theta[0], theta[1:]
+        z = X @ w + b
+        loss = np.mean(np.logaddexp(0.0, z) - y * z) + 0.5 * l2 * (w @ w)
+        residual = _sigmoid(z) - y
+        gradient = np.empty(p + 1)
+        gradient[0] = residual.mean()
+        gradient[1:] = (XT @ residual) / n + l2 * w
+        return loss, gradient
+
+    result = minimize(loss_and_gradient, np.zeros(p + 1), jac=True, method="L-BFGS-B",
+                      options={"gtol": tol, "maxiter": max_iter})
+    return result.x[1:], result.x[0]
+
+
+# ---------------------------------------------------------------------------
+# Mini-batch SGD with sparse updates
+# ---------------------------------------------------------------------------
+# A batch of 32 rows x 50 nnz touches at most 1,600 of the 1,000,000
+# weights. Computing Xᵀr as a dense p-vector would cost O(p) per step just
+# to allocate it. Instead, scatter-add each non-zero's contribution into
+# the handful of columns the batch actually uses:
+#     g_j = Σ_{rows i in batch, X_ij ≠ 0} X_ij · r_i
+
+def sgd_sparse(X, y, model="logistic", batch_size=32, epochs=1, learning_rate=5.0, decay=1e-4, seed=0):
+    """
+    Mini-batch SGD where each step costs O(nnz of the batch), not O(p).
+    model: "linear" (MSE) or "logistic" (log loss). Returns (coef, intercept).
+    """
+    X = _as_csr(X)
+    n, p = X.shape
+    y = np.asarray(y, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    coef, intercept = np.zeros(p), 0.0
+    scale = 2.0 if model == "linear" else 1.0
+    t = 0
+
+    for _ in range(epochs):
+        order = rng.permutation(n)
+        for start in range(0, n, batch_size):
+            batch = X[order[start:start + batch_size]]       # CSR row slice
+            z = batch @ coef + intercept
+            prediction = z if model == "linear" else _sigmoid(z)
+            residual = scale * (prediction - y[order[start:start + batch_size]]) / batch.shape[0]
+
+            # Scatter-add over the columns present in this batch only
+            row_of_nnz = np.repeat(np.arange(batch.shape[0]), np.diff(batch.indptr))
+            cols, slot = np.unique(batch.indices, return_inverse=True)
+            grad_cols = np.bincount(slot, weights=batch.data * residual[row_of_nnz], minlength=len(cols))
+
+            lr = learning_rate / (1.0 + decay * t)
+            coef[cols] -= lr * grad_cols
+            intercept -= lr * residual.sum()
+            t += 1
+
+    return coef, intercept
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(42)
+
+    # -----------------------------------------------------------------------
+    # 1) Correctness: implicit intercept == dense ones column
+    # -----------------------------------------------------------------------
+    X_small = sp.random(2_000, 30, density=0.2, format="csr", random_state=0)
+    y_small = 3 + X_small @ np.full(30, 2.0) + 0.5 * rng.standard_normal(2_000)
+    X_dense = np.column_stack([np.ones(2_000), X_small.toarray()])
+    beta_dense = np.linalg.lstsq(X_dense, y_small, rcond=None)[0]
+    coef, intercept, _ = fit_linear_lsqr(X_small, y_small)
+    coef_gd, intercept_gd = gradient_descent_sparse(X_small, y_small, learning_rate=0.5, n_iterations=20_000)
+    # Damped: dense ridge with the intercept left out of the penalty
+    damp = 3.0
+    penalty = damp ** 2 * np.diag(np.r_[0.0, np.ones(30)])
+    beta_ridge = np.linalg.solve(X_dense.T @ X_dense + penalty, X_dense.T @ y_small)
+    coef_r, intercept_r, _ = fit_linear_lsqr(X_small, y_small, damp=damp)
+
+    print("=== Sparse vs dense solve (n=2,000, p=30, 20% non-zero) ===")
+    print(f"LSQR:             max |Δβ| = {np.max(np.abs(np.r_[intercept, coef] - beta_dense)):.2e}")
+    print(f"LSQR, damp={damp}:   max |Δβ| = {np.max(np.abs(np.r_[intercept_r, coef_r] - beta_ridge)):.2e}  "
+          f"(vs ridge, intercept unpenalized)")
+    print(f"Gradient descent: max |Δβ| = {np.max(np.abs(np.r_[intercept_gd, coef_gd] - beta_dense)):.2e}")
+
+    # -----------------------------------------------------------------------
+    # 2) Hashed-feature data: p = 1,000,000 columns, 50 non-zeros per row
+    # -----------------------------------------------------------------------
+    # Half of each row's features come from 10,000 "popular" columns that
+    # carry signal; the other half from the long tail, which is pure noise.
+    n, p, nnz_per_row, n_popular = 200_000, 1_000_000, 50, 10_000
+
+    def random_csr(n_rows):
+        half = n_rows * nnz_per_row // 2
+        indices = np.concatenate([
+            rng.integers(0, n_popular, (n_rows, nnz_per_row // 2)),
+            rng.integers(n_popular, p, (n_rows, nnz_per_row // 2)),
+        ], axis=1).ravel()
+        indptr = np.arange(0, 2 * half + 1, nnz_per_row)
+        data = np.ones(2 * half) / np.sqrt(nnz_per_row)
+        X = sp.csr_matrix((data, indices, indptr), shape=(n_rows, p))
+        X.sum_duplicates()
+        return X
+
+    X_train, X_test = random_csr(n), random_csr(50_000)
+    w_true = np.zeros(p)
+    w_true[:n_popular] = 2 * rng.standard_normal(n_popular)
+    y_train = 3 + X_train @ w_true + 0.5 * rng.standard_normal(n)
+    y_test = 3 + X_test @ w_true + 0.5 * rng.standard_normal(50_000)
+
+    csr_mb = (X_train.data.nbytes + X_train.indices.nbytes + X_train.indptr.nbytes) / 1e6
+    print(f"\n=== Data: n={n:,}, p={p:,}, nnz={X_train.nnz:,} ===")
+    print(f"CSR: {csr_mb:,.0f} MB  |  dense float64 would be {n * p * 8 / 1e12:,.1f} TB")
+
+    def r2(y, y_hat):
+        return 1 - np.sum((y - y_hat) ** 2) / np.sum((y - y.mean()) ** 2)
+
+    # -----------------------------------------------------------------------
+    # Linear regression: LSQR (with a little damping — p > n here!)
+    # -----------------------------------------------------------------------
+    start = time.perf_counter()
+    coef, intercept, n_iter = fit_linear_lsqr(X_train, y_train, damp=1.0, max_iter=200)
+    elapsed = time.perf_counter() - start
+    print(f"\n=== Linear (LSQR, {n_iter} iterations, {elapsed:.1f}s) ===")
+    # b is unpenalized, but b = ȳ - μᵀw: with p > n the damped w is shrunk
+    # towards 0, so b lands near ȳ (this sample's ȳ is 3 + μᵀw_true ≈ 2.96)
+    print(f"Intercept: {intercept:.4f}  (true: 3.0, ȳ: {y_train.mean():.4f})")
+    print(f"Test R²:   {r2(y_test, predict_linear(X_test, coef, intercept)):.4f}")
+
+    # -----------------------------------------------------------------------
+    # Logistic regression: full-batch L-BFGS and sparse mini-batch SGD
+    # -----------------------------------------------------------------------
+    y_train_cls = (rng.random(n) < _sigmoid(X_train @ w_true)).astype(float)
+    y_test_cls = (rng.random(50_000) < _sigmoid(X_test @ w_true)).astype(float)
+
+    start = time.perf_counter()
+    coef, intercept = fit_logistic_lbfgs(X_train, y_train_cls, l2=1e-5, max_iter=100)
+    t_lbfgs = time.perf_counter() - start
+    acc_lbfgs = np.mean((predict_proba(X_test, coef, intercept) >= 0.5) == y_test_cls)
+
+    start = time.perf_counter()
+    coef, intercept = sgd_sparse(X_train, y_train_cls, model="logistic", epochs=3)
+    t_sgd = time.perf_counter() - start
+    acc_sgd = np.mean((predict_proba(X_test, coef, intercept) >= 0.5) == y_test_cls)
+
+    print(f"\n=== Logistic ===")
+    print(f"L-BFGS (full batch):    test accuracy {acc_lbfgs:.2%} in {t_lbfgs:.1f}s")
+    print(f"Sparse mini-batch SGD:  test accuracy {acc_sgd:.2%} in {t_sgd:.1f}s (3 epochs)")
+    print(f"Bayes-optimal accuracy: {np.mean((X_test @ w_true >= 0) == y_test_cls):.2%}")
@@ -0,0 +1,173 @@
+"""
+K-Fold and Leave-One-Out CV for Linear Regression — at the Cost of ONE Fit
+=============================================================================
+Naive k-fold CV refits the model k times, each on (k-1)/k of the data.
+For linear regression that's wasteful, because the Normal Equation only
+needs XᵀX and Xᵀy — and those are SUMS over rows:
+
+    XᵀX = Σ_folds G_f,    G_f = X_fᵀ X_f
+    Xᵀy = Σ_folds b_f,    b_f = X_fᵀ y_f
+
+So: one pass to compute the k small (p x p) fold Grams. Then the training
+set for fold f is "everything minus fold f":
+
+    β_(-f) = (XᵀX - G_f)⁻¹ (Xᵀy - b_f)
+
+and even the test error needs no second pass, because
+    Σ_{i in f} (y_i - x_iᵀβ)² = y_fᵀy_f - 2βᵀb_f + βᵀG_fβ
+
+Leave-one-out has an even better trick. The LOO residual of row i is
+
+    e_(-i) = e_i / (1 - h_ii),   h_ii = x_iᵀ (XᵀX)⁻¹ x_i
+
+where e_i is the ordinary residual and h_ii the hat-matrix diagonal.
+One fit + one pass for the h_ii = n refits for the price of ~2.
+"""
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+
+from streaming_normal_equation import accumulate_gram, iter_array_blocks, iter_residuals_and_leverage, with_intercept
+
+
+# ---------------------------------------------------------------------------
+# K-fold: per-fold sufficient statistics in one pass
+# ---------------------------------------------------------------------------
+
+def fold_statistics(blocks, k=5, seed=0):
+    """
+    One pass over (X_raw_block, y_block) pairs. Every row is assigned to a
+    random fold. Returns (G, b, yty, counts) with shapes
+    (k, p, p), (k, p), (k,), (k,) — p includes the intercept.
+    """
+    rng = np.random.default_rng(seed)
+    G = b = None
+    yty = np.zeros(k)
+    counts = np.zeros(k, dtype=np.int64)
+
+    for X_raw_block, y_block in blocks:
+        X_block = with_intercept(X_raw_block)
+        y_block = np.asarray(y_block, dtype=np.float64)
+        if G is None:
+            p = X_block.shape[1]
+            G = np.zeros((k, p, p))
+            b = np.zeros((k, p))
+
+        folds = rng.integers(0, k, len(y_block))
+        for f in range(k):
+            X_f, y_f = X_block[folds == f], y_block[folds == f]
+            G[f] += X_f.T @ X_f
+            b[f] += X_f.T @ y_f
+            yty[f] += y_f @ y_f
+            counts[f] += len(y_f)
+
+    if G is None:
+        raise ValueError("No data: the block iterator was empty")
+    return G, b, yty, counts
+
+
+def kfold_cv(blocks, k=5, seed=0):
+    """
+    K-fold CV from a single data pass.
+
+    Returns (fold_mse, betas, counts): per-fold test MSE (k,), the k
+    training solutions (k, p) and the fold sizes (k,). The CV estimate is
+    fold_mse weighted by fold size — see cv_mse in the demo.
+    """
+    G, b, yty, counts = fold_statistics(blocks, k=k, seed=seed)
+    G_total, b_total = G.sum(axis=0), b.sum(axis=0)
+
+    fold_mse = np.empty(k)
+    betas = np.empty_like(b)
+    for f in range(k):
+        # "Downdate": remove fold f from the totals, solve the p x p system
+        beta = cho_solve(cho_factor(G_total - G[f]), b_total - b[f])
+        sse = yty[f] - 2 * beta @ b[f] + beta @ G[f] @ beta
+        fold_mse[f] = sse / counts[f]
+        betas[f] = beta
+    return fold_mse, betas, counts
+
+
+# ---------------------------------------------------------------------------
+# Leave-one-out via hat-matrix diagonals
+# ---------------------------------------------------------------------------
+# With XᵀX = LLᵀ (Cholesky), h_ii = ||L⁻¹ x_i||². For a block of rows,
+# one triangular solve gives all of them — never the n x n hat matrix
+# (iter_residuals_and_leverage in streaming_normal_equation.py).
+
+def loo_cv(X_raw, y, chunk_rows=100_000):
+    """
+    Exact leave-one-out CV MSE (the PRESS statistic / n).
+    Two chunked passes: one for XᵀX, Xᵀy; one for residuals and h_ii.
+    Works with np.load(..., mmap_mode="r") arrays.
+    """
+    XtX, Xty, _, n = accumulate_gram(iter_array_blocks(X_raw, y, chunk_rows))
+    L = np.linalg.cholesky(XtX)
+    beta = cho_solve((L, True), Xty)
+
+    press = 0.0
+    for _, residuals, leverage in iter_residuals_and_leverage(X_raw, y, beta, L, chunk_rows):
+        press += np.sum((residuals / (1.0 - leverage)) ** 2)
+
+    return press / n, beta
+
+
+if __name__ == "__main__":
+    import time
+
+    # -----------------------------------------------------------------------
+    # y = 3 + 2*x₁ + 2*x₂ + ... + noise, with a few features
+    # -----------------------------------------------------------------------
+    rng = np.random.default_rng(42)
+    n, p = 200_000, 5
+    X_raw = rng.standard_normal((n, p))
+    y = 3 + X_raw @ np.full(p, 2.0) + rng.standard_normal(n) * 0.5
+
+    def blocks(chunk=50_000):
+        for start in range(0, n, chunk):
+            yield X_raw[start:start + chunk], y[start:start + chunk]
+
+    # -----------------------------------------------------------------------
+    # K-fold: one pass vs k refits
+    # -----------------------------------------------------------------------
+    k = 10
+    start = time.perf_counter()
+    fold_mse, betas, counts = kfold_cv(blocks(), k=k)
+    cv_mse = np.sum(fold_mse * counts) / counts.sum()
+    t_fast = time.perf_counter() - start
+
+    # Naive: rebuild the folds with the same assignment, refit k times
+    start = time.perf_counter()
+    fold_rng = np.random.default_rng(0)
+    folds = np.concatenate([fold_rng.integers(0, k, len(yb)) for _, yb in blocks()])
+    X = with_intercept(X_raw)
+    naive_mse = np.empty(k)
+    for f in range(k):
+        train, test = folds != f, folds == f
+        beta = np.linalg.solve(X[train].T @ X[train], X[train].T @ y[train])
+        naive_mse[f] = np.mean((y[test] - X[test] @ beta) ** 2)
+    t_naive = time.perf_counter() - start
+
+    print(f"=== {k}-Fold CV, n={n:,}, p={p} ===")
+    print(f"CV MSE (one pass):  {cv_mse:.6f}  in {t_fast * 1000:6.1f} ms")
+    print(f"CV MSE (k refits):  {np.sum(naive_mse * counts) / n:.6f}  in {t_naive * 1000:6.1f} ms")
+    print(f"Max per-fold |Δ MSE|: {np.max(np.abs(fold_mse - naive_mse)):.2e}")
+
+    # -----------------------------------------------------------------------
+    # Leave-one-out: hat diagonals vs literally refitting n times
+    # -----------------------------------------------------------------------
+    start = time.perf_counter()
+    loo_mse, _ = loo_cv(X_raw, y)
+    t_loo = time.perf_counter() - start
+
+    n_check = 300   # brute force on a subset — n refits is the whole point
+    loo_small, _ = loo_cv(X_raw[:n_check], y[:n_check])
+    X_small, y_small = X[:n_check], y[:n_check]
+    brute = np.mean([
+        (y_small[i] - X_small[i] @ np.linalg.lstsq(np.delete(X_small, i, 0), np.delete(y_small, i), rcond=None)[0]) ** 2
+        for i in range(n_check)
+    ])
+
+    print(f"\n=== Leave-One-Out CV ===")
+    print(f"LOO MSE (n={n:,}, via h_ii): {loo_mse:.6f}  in {t_loo * 1000:.1f} ms")
+    print(f"Subset n={n_check}: hat trick {loo_small:.8f} vs {n_check} refits {brute:.8f}")
@@ -0,0 +1,166 @@
+"""
+Influence and Multicollinearity Diagnostics at Scale (NumPy + SciPy)
+======================================================================
+03_assumptions_and_diagnostics.md lists what to check after a fit:
+outliers, influential points, multicollinearity. The textbook formulas
+all go through the hat matrix
+
+    H = X (XᵀX)⁻¹ Xᵀ          (n x n — 8 TB for a million rows)
+
+But every diagnostic only needs its DIAGONAL. With XᵀX = LLᵀ (Cholesky):
+
+    h_ii = x_iᵀ (XᵀX)⁻¹ x_i = ||L⁻¹ x_i||²
+
+One triangular solve per chunk of rows gives all of them — the same
+pass loo_cv uses (streaming_normal_equation.py). From h_ii and the
+residuals e_i:
+
+    leverage               h_ii          (average is p/n; > 2p/n is "high")
+    studentized residual   r_i = e_i / (s·√(1 - h_ii))
+    externally studentized t_i = r_i · √((n-p-1) / (n-p-r_i²))
+                           (s recomputed WITHOUT row i — no refit needed)
+    Cook's distance        D_i = r_i² · h_ii / (p·(1 - h_ii))
+                           (how far β moves if row i is deleted)
+
+And VIF needs no pass over the data at all: VIF_j = [R⁻¹]_jj, where R is
+the feature correlation matrix — which comes straight from XᵀX.
+
+Total cost: two chunked passes, O(np²). Memory: O(p² + chunk·p), plus the
+n-sized outputs themselves.
+"""
+
+import numpy as np
+from scipy.linalg import cho_solve, solve_triangular
+
+from streaming_normal_equation import accumulate_gram, iter_array_blocks, iter_residuals_and_leverage, with_intercept
+
+
+def vif_from_gram(XtX, n):
+    """
+    Variance inflation factors from the Gram matrix of [1, X_raw]
+    (intercept column FIRST). One value per raw feature.
+
+    VIF_j = 1 / (1 - R²_j), R²_j from regressing feature j on the others,
+    which equals the j-th diagonal of the inverse correlation matrix.
+    """
+    # Center on the statistics (as in ridge_path.py), then scale to correlations
+    x_mean = XtX[0, 1:] / n
+    cov = XtX[1:, 1:] - n * np.outer(x_mean, x_mean)
+    std = np.sqrt(np.diag(cov))
+    corr = cov / np.outer(std, std)
+
+    # diag(R⁻¹) = column sums of squares of L⁻¹ (R = LLᵀ) — no explicit inverse
+    L = np.linalg.cholesky(corr)
+    L_inv = solve_triangular(L, np.eye(len(corr)), lower=True)
+    return np.sum(L_inv ** 2, axis=0)
+
+
+def regression_diagnostics(X_raw, y, chunk_rows=100_000):
+    """
+    Fit OLS and compute per-row influence diagnostics in two chunked passes.
+    Works with np.load(..., mmap_mode="r") arrays. X_raw WITHOUT the ones column.
+
+    Returns a dict with:
+      beta, s (residual std. error), vif (per raw feature), and the n-sized
+      arrays residuals, leverage, studentized, studentized_external, cooks_distance
+    """
+    n = X_raw.shape[0]
+    p = 1 + (X_raw.shape[1] if X_raw.ndim > 1 else 1)
+    if n <= p + 1:
+        raise ValueError(f"Need more rows than parameters + 1 (n={n}, p={p})")
+
+    # Pass 1: sufficient statistics (as streaming_normal_equation.py)
+    XtX, Xty, _, _ = accumulate_gram(iter_array_blocks(X_raw, y, chunk_rows))
+    L = np.linalg.cholesky(XtX)
+    beta = cho_solve((L, True), Xty)
+
+    # Pass 2: residuals and hat diagonals, chunk by chunk (as loo_cv)
+    residuals = np.empty(n)
+    leverage = np.empty(n)
+    for start, residuals_block, leverage_block in iter_residuals_and_leverage(X_raw, y, beta, L, chunk_rows):
+        residuals[start:start + len(residuals_block)] = residuals_block
+        leverage[start:start + len(leverage_block)] = leverage_block
+
+    # Everything else is elementwise
+    dof = n - p
+    s = np.sqrt(residuals @ residuals / dof)
+    one_minus_h = 1.0 - leverage
+    studentized = residuals / (s * np.sqrt(one_minus_h))
+    # Clip guards the (measure-zero) case r² = dof from a 0/0
+    studentized_external = studentized * np.sqrt((dof - 1) / np.clip(dof - studentized ** 2, 1e-12, None))
+    cooks_distance = studentized ** 2 * leverage / (p * one_minus_h)
+
+    return {
+        "beta": beta,
+        "s": s,
+        "vif": vif_from_gram(XtX, n),
+        "residuals": residuals,
+        "leverage": leverage,
+        "studentized": studentized,
+        "studentized_external": studentized_external,
+        "cooks_distance": cooks_distance,
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(42)
+
+    # -----------------------------------------------------------------------
+    # 1) Correctness: vs the textbook formulas with the full hat matrix
+    # -----------------------------------------------------------------------
+    n, p = 500, 4
+    X_raw = rng.standard_normal((n, p))
+    y = 3 + X_raw @ np.full(p, 2.0) + rng.standard_normal(n) * 0.5
+    d = regression_diagnostics(X_raw, y, chunk_rows=128)
+
+    X = with_intercept(X_raw)
+    H = X @ np.linalg.inv(X.T @ X) @ X.T                    # n x n: fine for n = 500 only
+    e = y - H @ y
+    h = np.diag(H)
+    s2 = e @ e / (n - p - 1)
+    r = e / np.sqrt(s2 * (1 - h))
+    cooks = r ** 2 * h / ((p + 1) * (1 - h))
+    # Externally studentized by brute force: refit without row i
+    t_brute = np.empty(n)
+    for i in range(n):
+        keep = np.arange(n) != i
+        e_i = y[keep] - X[keep] @ np.linalg.lstsq(X[keep], y[keep], rcond=None)[0]
+        t_brute[i] = e[i] / np.sqrt(e_i @ e_i / (n - 1 - p - 1) * (1 - h[i]))
+    # VIF by definition: 1 / (1 - R²) from regressing x_j on the other features
+    vif_brute = []
+    for j in range(p):
+        others = with_intercept(np.delete(X_raw, j, axis=1))
+        resid = X_raw[:, j] - others @ np.linalg.lstsq(others, X_raw[:, j], rcond=None)[0]
+        vif_brute.append(1 / (resid @ resid / np.sum((X_raw[:, j] - X_raw[:, j].mean()) ** 2)))
+
+    print(f"=== Chunked diagnostics vs full hat matrix (n={n}) ===")
+    print(f"Leverage:               max |Δ| = {np.max(np.abs(d['leverage'] - h)):.1e}")
+    print(f"Studentized residuals:  max |Δ| = {np.max(np.abs(d['studentized'] - r)):.1e}")
+    print(f"Externally studentized: max |Δ| = {np.max(np.abs(d['studentized_external'] - t_brute)):.1e}  (vs {n} refits)")
+    print(f"Cook's distance:        max |Δ| = {np.max(np.abs(d['cooks_distance'] - cooks)):.1e}")
+    print(f"VIF:                    max |Δ| = {np.max(np.abs(d['vif'] - vif_brute)):.1e}  (vs {p} auxiliary regressions)")
+
+    # -----------------------------------------------------------------------
+    # 2) Production size: 2M rows, with planted problems
+    # -----------------------------------------------------------------------
+    n, p = 2_000_000, 10
+    X_raw = rng.standard_normal((n, p))
+    X_raw[:, 1] = X_raw[:, 0] + 0.1 * rng.standard_normal(n)      # x₁ ≈ x₀: multicollinear
+    y = 3 + X_raw @ np.full(p, 2.0) + rng.standard_normal(n) * 0.5
+    X_raw[:5, 2] = 60.0                                           # 5 high-leverage rows...
+    y[:5] -= 150.0                                                # ...that also pull β
+    y[5:10] += 8.0                                                # 5 plain outliers
+
+    start = time.perf_counter()
+    d = regression_diagnostics(X_raw, y)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n=== n={n:,}, p={p}: all diagnostics in {elapsed:.2f}s (the hat matrix would be {n * n * 8 / 1e12:,.0f} TB) ===")
+    print(f"VIF: {np.round(d['vif'], 1)}   (x₀, x₁ > 10 → multicollinear)")
+    top_cook = np.argsort(d["cooks_distance"])[::-1][:5]
+    top_t = np.argsort(np.abs(d["studentized_external"]))[::-1][:10]
+    print(f"Top 5 Cook's distance rows:           {sorted(top_cook.tolist())}  (planted: 0-4)")
+    print(f"Top 10 |externally studentized| rows: {sorted(top_t.tolist())}  (planted: 0-9)")
+    print(f"Rows with leverage > 2p/n: {np.sum(d['leverage'] > 2 * (p + 1) / n):,}")
@@ -10,6 +10,8 @@ This implements both:
 Run it, read the comments, and make sure you can explain every line.
 """
 
+import time
+
 import numpy as np
 
 # ---------------------------------------------------------------------------
@@ -62,12 +64,21 @@ print(f"Slope     (β₁): {beta_normal[1]:.4f}  (true: 2.0)")
 # Update rule: β := β - α * gradient
 # Gradient of MSE: (2/n) * Xᵀ(Xβ - y)
 
-def gradient_descent(X, y, learning_rate=0.1, n_iterations=1000, tolerance=1e-8):
-    """Solve for β using batch gradient descent."""
+def gradient_descent(X, y, learning_rate=0.1, n_iterations=1000, tolerance=1e-8, callback=None):
+    """
+    Solve for β using batch gradient descent.
+
+    callback: optional function called once per iteration with a dict of
+    {iteration, loss, gradient_norm, step_size, seconds, rows_per_sec}.
+    See optimization/instrumentation.py for ready-made sinks.
+    """
     n = len(y)
     beta = np.zeros(X.shape[1])  # Start with all zeros (could be random too)
 
     for i in range(n_iterations):
+        if callback is not None:
+            start_ns = time.perf_counter_ns()
+
         # Forward pass: make predictions
         y_pred = X @ beta
 
@@ -81,8 +92,22 @@ def gradient_descent(X, y, learning_rate=0.1, n_iterations=1000, tolerance=1e-8)
         # Take a step in the OPPOSITE direction (downhill)
         beta = beta - learning_rate * gradient
 
+        gradient_norm = np.linalg.norm(gradient)
+
+        # Report progress (only costs anything when a callback is attached)
+        if callback is not None:
+            seconds = (time.perf_counter_ns() - start_ns) * 1e-9
+            callback({
+                "iteration": i,
+                "loss": (residuals @ residuals) / n,   # MSE at the β we just used
+                "gradient_norm": gradient_norm,
+                "step_size": learning_rate,
+                "seconds": seconds,
+                "rows_per_sec": n / seconds if seconds > 0 else float("inf"),
+            })
+
         # Check for convergence: if the gradient is tiny, we're at the bottom
-        if np.linalg.norm(gradient) < tolerance:
+        if gradient_norm < tolerance:
             print(f"  Converged at iteration {i}")
             break
 
@@ -0,0 +1,177 @@
+"""
+Online Linear Regression: Recursive Least Squares (NumPy only)
+================================================================
+New rows arrive all day. Re-running the Normal Equation over the whole
+dataset for each one is O(np²). We don't have to.
+
+Keep P = (XᵀX)⁻¹ around. When a block of new rows X_new (m x p) arrives,
+the Woodbury identity updates the inverse directly:
+
+    (A + X_newᵀX_new)⁻¹ = P - P X_newᵀ (I + X_new P X_newᵀ)⁻¹ X_new P
+
+For one row (m = 1) that inner inverse is a scalar (Sherman–Morrison):
+O(p²) per event, independent of how much data we've seen. And β updates
+with a correction proportional to the prediction error:
+
+    β_new = β + P_new X_newᵀ (y_new - X_new β)
+
+Two extras for a world that changes over time:
+  - forgetting factor ρ < 1: old rows fade out geometrically
+        (A_new = ρA + X_newᵀX_new)
+  - downdates: REMOVE rows exactly, for a hard sliding window
+        (A_new = A - X_oldᵀX_old)
+"""
+
+import numpy as np
+
+
+class RecursiveLeastSquares:
+    """
+    Incrementally updated linear regression.
+
+        model = RecursiveLeastSquares.from_data(X_raw, y)   # or RecursiveLeastSquares(p)
+        model.update(x_new, y_new)                          # O(p²) per row
+        model.predict(X_raw)
+    """
+
+    def __init__(self, n_features, forgetting=1.0, prior=1e-6, fit_intercept=True):
+        """
+        n_features: number of raw features (no intercept column)
+        forgetting: ρ in (0, 1]; 1.0 = remember everything equally
+        prior:      start from A = prior·I (a tiny ridge), so P exists
+                    before any data arrives
+        """
+        if not 0.0 < forgetting <= 1.0:
+            raise ValueError(f"forgetting must be in (0, 1], got {forgetting}")
+        self.fit_intercept = fit_intercept
+        p = n_features + (1 if fit_intercept else 0)
+        self.forgetting = forgetting
+        self.P = np.eye(p) / prior
+        self.beta = np.zeros(p)
+        self.n_updates = 0
+
+    @classmethod
+    def from_data(cls, X_raw, y, **kwargs):
+        """Start from a batch fit (one Normal Equation), then go online."""
+        X_raw = np.asarray(X_raw, dtype=np.float64)
+        if X_raw.ndim == 1:
+            X_raw = X_raw[:, None]
+        model = cls(X_raw.shape[1], **kwargs)
+        X = model._design(X_raw)
+        model.P = np.linalg.inv(X.T @ X)   # the one inverse we keep on purpose
+        model.beta = model.P @ (X.T @ np.asarray(y, dtype=np.float64))
+        return model
+
+    def _design(self, X_raw):
+        X_raw = np.atleast_2d(np.asarray(X_raw, dtype=np.float64))
+        if self.fit_intercept:
+            return np.column_stack([np.ones(X_raw.shape[0]), X_raw])
+        return X_raw
+
+    # -----------------------------------------------------------------------
+    # The core: one Woodbury step, adding (+1) or removing (-1) rows
+    # -----------------------------------------------------------------------
+
+    def _woodbury(self, X, y, sign, rho):
+        # P_new = (ρA + sign·XᵀX)⁻¹
+        #       = (1/ρ)·[P - P Xᵀ (ρ·sign·I + X P Xᵀ)⁻¹ X P]
+        PXt = self.P @ X.T                                  # (p x m)
+        if X.shape[0] == 1:
+            # Sherman–Morrison: the "inverse" is a division by a scalar
+            Px = PXt[:, 0]
+            self.P = (self.P - np.outer(Px, Px) / (sign * rho + X[0] @ Px)) / rho
+        else:
+            inner = X @ PXt                                 # (m x m)
+            inner[np.diag_indices_from(inner)] += sign * rho
+            self.P = (self.P - PXt @ np.linalg.solve(inner, PXt.T)) / rho
+        self.P = 0.5 * (self.P + self.P.T)                  # stop round-off asymmetry from growing
+
+        # β_new = β + sign·P_new Xᵀ (y - Xβ)
+        residuals = y - X @ self.beta
+        self.beta = self.beta + sign * (self.P @ (X.T @ residuals))
+
+    def update(self, X_raw, y):
+        """Add one row (1-D x) or a block of rows. O(p²m + m³)."""
+        X = self._design(X_raw)
+        self._woodbury(X, np.atleast_1d(np.asarray(y, dtype=np.float64)), +1.0, self.forgetting)
+        self.n_updates += X.shape[0]
+        return self
+
+    def downdate(self, X_raw, y):
+        """
+        Remove rows that were previously added (sliding windows).
+        Only exact with forgetting=1.0 — with forgetting, old rows have
+        already been partly forgotten.
+        """
+        if self.forgetting != 1.0:
+            raise ValueError("downdate() requires forgetting=1.0")
+        X = self._design(X_raw)
+        self._woodbury(X, np.atleast_1d(np.asarray(y, dtype=np.float64)), -1.0, 1.0)
+        self.n_updates -= X.shape[0]
+        return self
+
+    def predict(self, X_raw):
+        return self._design(X_raw) @ self.beta
+
+
+if __name__ == "__main__":
+    import collections
+    import time
+
+    rng = np.random.default_rng(42)
+
+    # -----------------------------------------------------------------------
+    # 1) Exactness: online updates == refitting from scratch
+    # -----------------------------------------------------------------------
+    # Same story as example_numpy.py: y = 3 + 2*x + noise
+    X_raw = 2 * rng.random((1_000, 1))
+    y = 3 + 2 * X_raw[:, 0] + rng.standard_normal(1_000) * 0.5
+
+    model = RecursiveLeastSquares.from_data(X_raw[:100], y[:100])
+    start = time.perf_counter()
+    for i in range(100, 1_000):
+        model.update(X_raw[i], y[i])             # one event at a time
+    per_event_us = (time.perf_counter() - start) / 900 * 1e6
+
+    X = np.column_stack([np.ones(1_000), X_raw])
+    beta_refit = np.linalg.solve(X.T @ X, X.T @ y)
+
+    print("=== Online RLS vs full refit (900 single-row updates) ===")
+    print(f"Online: β₀={model.beta[0]:.6f}, β₁={model.beta[1]:.6f}")
+    print(f"Refit:  β₀={beta_refit[0]:.6f}, β₁={beta_refit[1]:.6f}")
+    print(f"Max |Δβ|: {np.max(np.abs(model.beta - beta_refit)):.2e} | {per_event_us:.1f} µs per event")
+
+    # -----------------------------------------------------------------------
+    # 2) A drifting world: the true slope moves from 2 to 4 over time
+    # -----------------------------------------------------------------------
+    n_stream, window = 20_000, 2_000
+    x_stream = 2 * rng.random((n_stream, 1))
+    slope_t = np.linspace(2.0, 4.0, n_stream)
+    y_stream = 3 + slope_t * x_stream[:, 0] + rng.standard_normal(n_stream) * 0.5
+
+    block = 100
+    everything = RecursiveLeastSquares(1)
+    # ρ is applied once per update() call: 0.999 per row = 0.999¹⁰⁰ per block.
+    # Memory ≈ 1/(1 - 0.999) = 1000 rows.
+    forgetful = RecursiveLeastSquares(1, forgetting=0.999 ** block)
+    sliding = RecursiveLeastSquares(1)
+    recent = collections.deque()
+
+    for start in range(0, n_stream, block):
+        Xb, yb = x_stream[start:start + block], y_stream[start:start + block]
+        everything.update(Xb, yb)
+        forgetful.update(Xb, yb)
+        sliding.update(Xb, yb)
+        recent.append((Xb, yb))
+        if len(recent) * block > window:
+            sliding.downdate(*recent.popleft())
+
+    print(f"\n=== Drifting slope (true final slope: {slope_t[-1]:.2f}) ===")
+    print(f"Remember everything:          slope = {everything.beta[1]:.3f}")
+    print(f"Forgetting ρ=0.999 per row:   slope = {forgetful.beta[1]:.3f}")
+    print(f"Sliding window ({window:,} rows):  slope = {sliding.beta[1]:.3f}")
+
+    X_win = np.column_stack([np.ones(window), x_stream[-window:]])
+    beta_win = np.linalg.solve(X_win.T @ X_win, X_win.T @ y_stream[-window:])
+    print(f"Refit on last {window:,} rows:     slope = {beta_win[1]:.3f}  "
+          f"(|Δ| vs sliding: {abs(beta_win[1] - sliding.beta[1]):.1e})")
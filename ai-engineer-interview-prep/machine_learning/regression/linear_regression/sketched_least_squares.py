@@ -0,0 +1,246 @@
+"""
+Randomized Least Squares: Sketch-and-Precondition (NumPy + SciPy)
+===================================================================
+Tall data: n = 1,000,000 rows, p = 50 features. The two methods in
+example_numpy.py both have a weak spot here:
+
+  - normal_equation forms XᵀX, which SQUARES the condition number.
+    cond(X) = 10⁷ → cond(XᵀX) = 10¹⁴, and float64 only has ~16 digits.
+  - gradient_descent needs ~cond(X)² iterations on the same problem.
+    Each one is a full pass over the data.
+
+Random sketching fixes both. Multiply X by a random s x n matrix S with
+s ≈ 4p ≪ n. The sketch SX is tiny, yet with high probability it keeps
+the geometry of X:  ||SXβ|| ≈ ||Xβ|| for every β.
+
+  1. Sketch-and-solve: solve the tiny problem min ||S(Xβ - y)||.
+     One pass over the data, answer within a small factor of optimal.
+     Good for "roughly right, right now".
+  2. Sketch-and-precondition: QR the sketch, SX = QR. Then X R⁻¹ has
+     condition number ≈ 3 no matter how bad X was. LSQR on X R⁻¹
+     converges to full accuracy in ~20–30 iterations, and never forms XᵀX.
+  3. Sketch-preconditioned normal equations: because X R⁻¹ is so well
+     conditioned, its OWN normal equations are safe. One chunked pass
+     builds (XR⁻¹)ᵀ(XR⁻¹), and one refinement pass cleans up the rounding.
+
+Speed, plainly (the demo: n = 1M, p = 51, cond(X) ≈ 10⁷, one core):
+  normal_equation             ~0.2 s   — but the answer is visibly wrong
+  np.linalg.lstsq (dense QR)  ~4 s     — exact
+  sketch + normal equations   ~1 s     — exact, ~5x slower than normal_equation
+  sketch + LSQR               ~4 s     — exact, no faster than dense QR:
+                                          ~25 iterations x 2 passes over X
+So mode 3 is the one to use on in-memory arrays. LSQR earns its place
+when X is only available as X @ v and Xᵀ @ r (sparse, or an operator).
+
+Two kinds of sketch S:
+  - sparse sign embedding: each row of X is added (with a random ±) into
+    a few random rows of the sketch. Cost O(nnz(X)·k) — the cheapest.
+  - SRHT (subsampled randomized Hadamard transform): flip signs, mix all
+    rows with a fast orthogonal transform, keep s random rows. We use the
+    DCT as the orthogonal transform — same guarantees, no padding n to a
+    power of 2, and scipy ships a fast one.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.fft import dct
+from scipy.linalg import cho_factor, cho_solve, qr, solve_triangular
+from scipy.sparse.linalg import LinearOperator, lsqr
+
+
+# ---------------------------------------------------------------------------
+# Sketches: each returns S @ A for A of shape (n,) or (n, p).
+# The same seed gives the same S, so X and y can be sketched separately.
+# ---------------------------------------------------------------------------
+
+def _sparse_sign_matrix(n, sketch_size, seed=0, nnz_per_row=8):
+    k = min(nnz_per_row, sketch_size)
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, sketch_size, n * k)
+    signs = (2.0 * rng.integers(0, 2, n * k) - 1.0) / np.sqrt(k)
+    # Built column by column (CSC): column i holds the k slots of data row i
+    return sp.csc_matrix((signs, rows, np.arange(0, n * k + 1, k)), shape=(sketch_size, n))
+
+
+def sparse_sign_sketch(A, sketch_size, seed=0, nnz_per_row=8):
+    """
+    S @ A where every column of S has `nnz_per_row` entries of ±1/√k.
+    (Each data row lands in k sketch rows.) Cost: O(n·p·k).
+    """
+    return _sparse_sign_matrix(A.shape[0], sketch_size, seed, nnz_per_row) @ A
+
+
+def srht_sketch(A, sketch_size, seed=0):
+    """
+    S @ A with S = √(n/s) · (sample s rows) · DCT · diag(±1).
+    Cost: O(n·p·log n), and one temporary copy of A.
+    """
+    n = A.shape[0]
+    rng = np.random.default_rng(seed)
+    signs = 2.0 * rng.integers(0, 2, n) - 1.0
+    mixed = dct(signs.reshape((n,) + (1,) * (A.ndim - 1)) * A, axis=0, norm="ortho")
+    keep = rng.choice(n, sketch_size, replace=False)
+    return np.sqrt(n / sketch_size) * mixed[keep]
+
+
+SKETCHES = {"sparse": sparse_sign_sketch, "srht": srht_sketch}
+
+
+def _sketch_xy(X, y, sketch, sketch_size, seed):
+    if sketch not in SKETCHES:
+        raise ValueError(f"sketch must be one of {sorted(SKETCHES)}, got {sketch!r}")
+    n, p = X.shape
+    s = min(n, sketch_size or 4 * p)
+    if sketch == "sparse":
+        S = _sparse_sign_matrix(n, s, seed)                  # build S once, apply to both
+        return S @ X, (None if y is None else S @ y)
+    return srht_sketch(X, s, seed), (None if y is None else srht_sketch(y, s, seed))
+
+
+def _sketch_r_factor(SX):
+    R = qr(SX, mode="r")[0][:SX.shape[1]]
+    if np.min(np.abs(np.diag(R))) <= 1e-14 * np.max(np.abs(np.diag(R))):
+        raise np.linalg.LinAlgError("X is rank deficient (perfectly collinear columns?)")
+    return R
+
+
+# ---------------------------------------------------------------------------
+# Mode 1: sketch-and-solve (approximate, one pass)
+# ---------------------------------------------------------------------------
+
+def sketch_and_solve(X, y, sketch="sparse", sketch_size=None, seed=0):
+    """
+    Approximate least squares: β = argmin ||S X β - S y||.
+    X must include the column of ones (as in example_numpy.py).
+    Bigger sketch_size (default 4p) = closer to the exact answer.
+    """
+    SX, Sy = _sketch_xy(X, y, sketch, sketch_size, seed)
+    return np.linalg.lstsq(SX, Sy, rcond=None)[0]
+
+
+# ---------------------------------------------------------------------------
+# Mode 2: sketch-and-precondition (exact, a handful of passes)
+# ---------------------------------------------------------------------------
+# SX = QR. Substitute β = R⁻¹z: min ||X R⁻¹ z - y|| is the SAME problem,
+# but X R⁻¹ is well conditioned, so LSQR needs few iterations. Each
+# iteration is one X @ v and one Xᵀ @ r — never XᵀX.
+
+def sketch_precondition_lsqr(X, y, sketch="sparse", sketch_size=None, tol=1e-10, max_iter=100, seed=0):
+    """
+    Full-accuracy least squares for tall X (n ≫ p), using only X @ v and
+    Xᵀ @ r — the version to use when X is an operator, not an array.
+    X must include the column of ones. Returns (beta, n_iterations).
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    SX, Sy = _sketch_xy(X, y, sketch, sketch_size, seed)
+    R = _sketch_r_factor(SX)
+
+    A = LinearOperator(
+        X.shape, dtype=np.float64,
+        matvec=lambda z: X @ solve_triangular(R, z),
+        rmatvec=lambda r: solve_triangular(R, X.T @ r, trans="T"),
+    )
+
+    # Warm start from the sketch-and-solve answer: z₀ = Rβ_sketch
+    z0 = R @ np.linalg.lstsq(SX, Sy, rcond=None)[0]
+    z, _, n_iter = lsqr(A, y, atol=tol, btol=tol, iter_lim=max_iter, x0=z0)[:3]
+    return solve_triangular(R, z), n_iter
+
+
+# ---------------------------------------------------------------------------
+# Mode 3: sketch-preconditioned normal equations (exact, two passes)
+# ---------------------------------------------------------------------------
+# LSQR is memory-bound: every iteration streams X twice, so ~25 iterations
+# cost ~50 passes. But Y = X R⁻¹ has cond ≈ 3, so its normal equations
+# are SAFE — squaring 3 gives 9, not 10¹⁴. One chunked pass builds YᵀY
+# and Yᵀy (one GEMM per chunk, never storing Y), and one refinement step
+# mops up the last rounding. Same speed class as normal_equation, same
+# accuracy as QR.
+
+def sketch_precondition_normal(X, y, sketch="sparse", sketch_size=None, refine=1, chunk_rows=16_384, seed=0):
+    """
+    Full-accuracy least squares for tall X (n ≫ p) in two passes over X
+    (plus one per refinement step). X must include the column of ones.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n, p = X.shape
+    R = _sketch_r_factor(_sketch_xy(X, None, sketch, sketch_size, seed)[0])   # y's sketch isn't needed
+    R_inv = solve_triangular(R, np.eye(p))                   # p x p: turns each chunk's solve into a GEMM
+
+    YtY = np.zeros((p, p))
+    Yty = np.zeros(p)
+    for start in range(0, n, chunk_rows):
+        Y_chunk = X[start:start + chunk_rows] @ R_inv
+        YtY += Y_chunk.T @ Y_chunk
+        Yty += Y_chunk.T @ y[start:start + chunk_rows]
+
+    factor = cho_factor(YtY)
+    beta = R_inv @ cho_solve(factor, Yty)
+    for _ in range(refine):
+        # Iterative refinement: solve for the correction from the residual
+        residual = y - X @ beta
+        beta += R_inv @ cho_solve(factor, R_inv.T @ (X.T @ residual))
+    return beta
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import time
+
+    with contextlib.redirect_stdout(io.StringIO()):   # example_numpy prints its own demo on import
+        from example_numpy import gradient_descent, normal_equation
+
+    # -----------------------------------------------------------------------
+    # Tall, badly conditioned data: cond(X) ≈ 10⁷
+    # -----------------------------------------------------------------------
+    # 50 features that are all the same signal plus a tiny bit of their own
+    # noise — nearly collinear. y = 3 + Σ 2·x_j + noise.
+    rng = np.random.default_rng(42)
+    n, p = 1_000_000, 50
+    X_raw = rng.standard_normal((n, 1)) + 1e-6 * rng.standard_normal((n, p))
+    X = np.column_stack([np.ones(n), X_raw])
+    y = 3 + X_raw @ np.full(p, 2.0) + 0.5 * rng.standard_normal(n)
+
+    print(f"=== n={n:,}, p={p + 1}, cond(X) ≈ {np.linalg.cond(X[:20_000]):.1e} ===")
+
+    # Reference: Householder QR on the full X (accurate, but O(np²) and a copy of X)
+    start = time.perf_counter()
+    beta_ref = np.linalg.lstsq(X, y, rcond=None)[0]
+    t_ref = time.perf_counter() - start
+
+    # With nearly collinear columns, many β fit almost equally well — so we
+    # judge each answer by its residual sum of squares, relative to the best.
+    rss_ref = np.sum((y - X @ beta_ref) ** 2)
+
+    def report(name, beta, seconds):
+        excess = np.sum((y - X @ beta) ** 2) / rss_ref - 1
+        print(f"{name:<32s} {seconds * 1000:8.0f} ms   {max(excess, 0.0):10.1e}")
+
+    print(f"{'Method':<32s} {'Time':>11s}   {'Excess RSS':>10s}")
+    report("np.linalg.lstsq (dense QR)", beta_ref, t_ref)
+
+    start = time.perf_counter()
+    beta_ne = normal_equation(X, y)
+    report("Normal equation", beta_ne, time.perf_counter() - start)
+
+    # Largest stable step: 1 / L, with L = 2·λ_max(XᵀX / n) (estimated on a sample)
+    lipschitz = 2 * np.linalg.norm(X[:20_000], 2) ** 2 / 20_000
+    start = time.perf_counter()
+    beta_gd = gradient_descent(X, y, learning_rate=1 / lipschitz, n_iterations=50)
+    report("Gradient descent (50 passes)", beta_gd, time.perf_counter() - start)
+
+    for sketch in ("sparse", "srht"):
+        start = time.perf_counter()
+        beta_sk = sketch_and_solve(X, y, sketch=sketch, sketch_size=20 * (p + 1))
+        report(f"Sketch-and-solve ({sketch})", beta_sk, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        beta_pc, n_iter = sketch_precondition_lsqr(X, y, sketch=sketch)
+        report(f"Sketch + LSQR ({sketch}, {n_iter} it)", beta_pc, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        beta_pn = sketch_precondition_normal(X, y, sketch=sketch)
+        report(f"Sketch + normal eq. ({sketch})", beta_pn, time.perf_counter() - start)
@@ -0,0 +1,153 @@
+"""
+Single-Pass Streaming Regression Metrics (NumPy only)
+=======================================================
+MSE, RMSE, MAE and R² for a holdout set too big to load at once.
+
+The catch is R²:
+
+    R² = 1 - SS_res / SS_tot,    SS_tot = Σ (y - ȳ)²
+
+SS_tot needs the mean ȳ FIRST — a second pass over the data. The fix is a
+running mean and a running sum of squared deviations (Welford), updated
+chunk by chunk. Two partial results can be MERGED exactly (Chan et al.),
+so each worker can score its own shard and the parent combines them.
+
+Memory: O(1). Five numbers, no matter how many rows.
+"""
+
+import numpy as np
+
+
+class RegressionMetrics:
+    """
+    Mergeable accumulator for MSE / RMSE / MAE / R².
+
+        metrics = RegressionMetrics()
+        for y_chunk, y_pred_chunk in chunks:
+            metrics.update(y_chunk, y_pred_chunk)
+        metrics.result()
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_y = 0.0      # running ȳ
+        self.m2_y = 0.0        # running Σ (y - ȳ)²  = SS_tot
+        self.sse = 0.0         # Σ (y - ŷ)²          = SS_res
+        self.sae = 0.0         # Σ |y - ŷ|
+
+    # -----------------------------------------------------------------------
+    # Update: fold in one chunk
+    # -----------------------------------------------------------------------
+    # Compute the chunk's own (n, mean, M2) with vectorized NumPy, then
+    # merge it in — one formula for both "new chunk" and "other worker".
+
+    def update(self, y_true, y_pred):
+        # Flatten first: a (n, 1) y_pred (X @ β with a column β) would
+        # otherwise broadcast against (n,) y_true into an n x n matrix
+        y_true = np.asarray(y_true, dtype=np.float64).ravel()
+        y_pred = np.asarray(y_pred, dtype=np.float64).ravel()
+        if y_true.size != y_pred.size:
+            raise ValueError(f"y_true has {y_true.size} values, y_pred has {y_pred.size}")
+        if y_true.size == 0:
+            return self
+
+        residuals = y_true - y_pred
+        chunk = RegressionMetrics()
+        chunk.n = y_true.size
+        chunk.mean_y = y_true.mean()
+        chunk.m2_y = np.sum((y_true - chunk.mean_y) ** 2)
+        chunk.sse = residuals @ residuals
+        chunk.sae = np.abs(residuals).sum()
+        return self.merge(chunk)
+
+    # -----------------------------------------------------------------------
+    # Merge: combine two partial results exactly
+    # -----------------------------------------------------------------------
+    # Chan's parallel formula. With δ = ȳ_b - ȳ_a:
+    #   ȳ   = ȳ_a + δ · n_b / n
+    #   M2  = M2_a + M2_b + δ² · n_a · n_b / n
+    # No catastrophic cancellation, unlike Σy² - n·ȳ².
+
+    def merge(self, other):
+        """Fold `other` into self (in place). Returns self."""
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean_y - self.mean_y
+        self.m2_y += other.m2_y + delta ** 2 * self.n * other.n / n
+        self.mean_y += delta * other.n / n
+        self.sse += other.sse
+        self.sae += other.sae
+        self.n = n
+        return self
+
+    def result(self):
+        if self.n == 0:
+            raise ValueError("No data: update() was never called with rows")
+        mse = self.sse / self.n
+        return {
+            "n": self.n,
+            "mse": mse,
+            "rmse": np.sqrt(mse),
+            "mae": self.sae / self.n,
+            "r2": 1.0 - self.sse / self.m2_y if self.m2_y > 0 else float("nan"),
+        }
+
+
+if __name__ == "__main__":
+    import time
+
+    # -----------------------------------------------------------------------
+    # A "huge" holdout set, generated chunk by chunk
+    # -----------------------------------------------------------------------
+    # True relationship: y = 3 + 2*x + noise (same as example_numpy.py).
+    # Pretend we already fitted β = [3, 2] and are scoring a holdout set.
+
+    beta = np.array([3.0, 2.0])
+    n_chunks, chunk_rows, n_workers = 40, 250_000, 4
+
+    def holdout_chunks(worker):
+        rng = np.random.default_rng(worker)
+        for _ in range(n_chunks // n_workers):
+            x = 2 * rng.random(chunk_rows)
+            y = 3 + 2 * x + rng.standard_normal(chunk_rows) * 0.5
+            yield y, beta[0] + beta[1] * x
+
+    # Each "worker" scores its own shard, then the parent merges
+    start = time.perf_counter()
+    partials = []
+    for worker in range(n_workers):
+        partial = RegressionMetrics()
+        for y_chunk, y_pred_chunk in holdout_chunks(worker):
+            partial.update(y_chunk, y_pred_chunk)
+        partials.append(partial)
+
+    total = RegressionMetrics()
+    for partial in partials:
+        total.merge(partial)
+    streamed = total.result()
+    elapsed = time.perf_counter() - start
+
+    # -----------------------------------------------------------------------
+    # Check against the two-pass, all-in-memory formulas from example_numpy.py
+    # -----------------------------------------------------------------------
+    y_all, y_pred_all = map(np.concatenate, zip(*[
+        (y_c, p_c) for w in range(n_workers) for y_c, p_c in holdout_chunks(w)
+    ]))
+    residuals = y_all - y_pred_all
+    exact = {
+        "mse": np.mean(residuals ** 2),
+        "mae": np.mean(np.abs(residuals)),
+        "r2": 1 - np.sum(residuals ** 2) / np.sum((y_all - np.mean(y_all)) ** 2),
+    }
+
+    print(f"=== Streaming Metrics: {streamed['n']:,} rows, {n_workers} merged shards ===")
+    print(f"MSE:  {streamed['mse']:.6f}  (noise variance: 0.25)")
+    print(f"RMSE: {streamed['rmse']:.6f}")
+    print(f"MAE:  {streamed['mae']:.6f}")
+    print(f"R²:   {streamed['r2']:.6f}")
+    print(f"Time: {elapsed:.2f}s, memory: 5 floats")
+
+    print("\n=== Difference from in-memory two-pass metrics ===")
+    for name, value in exact.items():
+        print(f"{name.upper():>4s}: {abs(streamed[name] - value):.2e}")
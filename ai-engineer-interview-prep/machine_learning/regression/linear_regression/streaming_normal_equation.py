@@ -0,0 +1,283 @@
+"""
+Out-of-Core Normal Equation (NumPy + SciPy)
+=============================================
+The Normal Equation when X does NOT fit in RAM.
+
+The trick: β only depends on XᵀX (p x p) and Xᵀy (p x 1).
+Both are SUMS over rows, so we can build them one block of rows at a time:
+
+    XᵀX = Σ_blocks  X_bᵀ X_b
+    Xᵀy = Σ_blocks  X_bᵀ y_b
+
+Peak memory is O(p² + chunk), no matter how many rows there are.
+Then we solve with a factorization instead of np.linalg.inv:
+  1. Cholesky of XᵀX (fast, the default)
+  2. TSQR — a streaming QR of X itself (slower, but never squares
+     the condition number)
+
+Run it, read the comments, and make sure you can explain every line.
+"""
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+
+
+# ---------------------------------------------------------------------------
+# Where the row blocks come from
+# ---------------------------------------------------------------------------
+# Anything that yields (X_block, y_block) pairs works: a generator reading a
+# database cursor, a parquet reader, or the memory-mapped .npy helper below.
+# np.load(mmap_mode="r") does NOT read the file — pages are pulled in by the
+# OS as we slice, so a sequential walk is one sequential read of the file.
+
+def iter_npy_blocks(X_path, y_path, chunk_rows=100_000):
+    """Yield (X_block, y_block) row blocks from memory-mapped .npy files."""
+    X_mm = np.load(X_path, mmap_mode="r")
+    y_mm = np.load(y_path, mmap_mode="r")
+    if X_mm.shape[0] != y_mm.shape[0]:
+        raise ValueError(f"X has {X_mm.shape[0]} rows but y has {y_mm.shape[0]}")
+
+    for start in range(0, X_mm.shape[0], chunk_rows):
+        stop = start + chunk_rows
+        # np.asarray copies only this slice into RAM (chunk_rows x p)
+        yield np.asarray(X_mm[start:stop]), np.asarray(y_mm[start:stop])
+
+
+def iter_array_blocks(X, y, chunk_rows=100_000):
+    """Yield row blocks from in-memory (or np.load(..., mmap_mode="r")) arrays."""
+    for start in range(0, X.shape[0], chunk_rows):
+        yield X[start:start + chunk_rows], y[start:start + chunk_rows]
+
+
+def with_intercept(X_block):
+    """Prepend the column of ones — per block, so we never build it for all n."""
+    X_block = np.asarray(X_block, dtype=np.float64)
+    if X_block.ndim == 1:
+        X_block = X_block[:, None]
+    return np.column_stack([np.ones(X_block.shape[0]), X_block])
+
+
+# ---------------------------------------------------------------------------
+# Step 1: accumulate the sufficient statistics
+# ---------------------------------------------------------------------------
+# XᵀX and Xᵀy are all the Normal Equation needs ("sufficient statistics").
+# We also keep yᵀy and n — free to collect, and they give us the training
+# MSE later without another pass:  SSE = yᵀy - 2βᵀXᵀy + βᵀXᵀXβ
+
+def accumulate_gram(blocks, fit_intercept=True):
+    """
+    One pass over the blocks. Returns (XtX, Xty, yty, n).
+    Memory: O(p²) for the accumulators + one block at a time.
+    """
+    XtX = None
+    Xty = None
+    yty = 0.0
+    n = 0
+
+    for X_block, y_block in blocks:
+        X_block = with_intercept(X_block) if fit_intercept else np.asarray(X_block, dtype=np.float64)
+        y_block = np.asarray(y_block, dtype=np.float64)
+
+        if XtX is None:
+            p = X_block.shape[1]
+            XtX = np.zeros((p, p))
+            Xty = np.zeros(p)
+
+        XtX += X_block.T @ X_block   # (p x chunk) @ (chunk x p) — one BLAS call
+        Xty += X_block.T @ y_block   # (p x chunk) @ (chunk,)
+        yty += y_block @ y_block
+        n += X_block.shape[0]
+
+    if XtX is None:
+        raise ValueError("No data: the block iterator was empty")
+    return XtX, Xty, yty, n
+
+
+# ---------------------------------------------------------------------------
+# Centered statistics, without forming XᵀX
+# ---------------------------------------------------------------------------
+# Ridge (and anything else with an unpenalized intercept) needs X_cᵀX_c,
+# X_c = X - x̄. Getting it as XᵀX - n·x̄x̄ᵀ subtracts two huge, nearly equal
+# numbers when |x̄| >> std(x): with x̄ = 1e6 and std = 1 each entry of XᵀX is
+# ~1e12·n and float64 keeps only ~4 digits of what's left. Instead, center
+# each block on its OWN mean (small numbers) and merge blocks with Chan's
+# formula — the matrix version of streaming_metrics.py's merge. With
+# δ = x̄_b - x̄ (and δ_y likewise):
+#   S_xx += S_xx,b + (n·n_b / (n + n_b)) δδᵀ
+#   S_xy += S_xy,b + (n·n_b / (n + n_b)) δ·δ_y
+#   x̄    += δ · n_b / (n + n_b)
+
+def accumulate_centered_gram(blocks):
+    """
+    One pass over (X_raw, y) blocks — X_raw WITHOUT the ones column.
+    Returns (gram_c, xty_c, x_mean, y_mean, n): X_cᵀX_c and X_cᵀy_c about
+    the full-data means.
+    """
+    gram_c = None
+    n = 0
+
+    for X_block, y_block in blocks:
+        X_block = np.asarray(X_block, dtype=np.float64)
+        if X_block.ndim == 1:
+            X_block = X_block[:, None]
+        y_block = np.asarray(y_block, dtype=np.float64)
+        n_b = X_block.shape[0]
+        if n_b == 0:
+            continue
+
+        x_mean_b = X_block.mean(axis=0)
+        y_mean_b = y_block.mean()
+        X_c = X_block - x_mean_b
+        if gram_c is None:
+            gram_c = X_c.T @ X_c
+            xty_c = X_c.T @ (y_block - y_mean_b)
+            x_mean, y_mean, n = x_mean_b, y_mean_b, n_b
+            continue
+
+        total = n + n_b
+        delta = x_mean_b - x_mean
+        delta_y = y_mean_b - y_mean
+        gram_c += X_c.T @ X_c + (n * n_b / total) * np.outer(delta, delta)
+        xty_c += X_c.T @ (y_block - y_mean_b) + (n * n_b / total) * delta * delta_y
+        x_mean = x_mean + delta * n_b / total
+        y_mean += delta_y * n_b / total
+        n = total
+
+    if gram_c is None:
+        raise ValueError("No data: the block iterator was empty")
+    return gram_c, xty_c, x_mean, y_mean, n
+
+
+# ---------------------------------------------------------------------------
+# A second pass: residuals and hat-matrix diagonals
+# ---------------------------------------------------------------------------
+# With XᵀX = LLᵀ (Cholesky), h_ii = x_iᵀ(XᵀX)⁻¹x_i = ||L⁻¹ x_i||². For a
+# block of rows, one triangular solve gives all of them — never the n x n
+# hat matrix. Leave-one-out CV (cross_validation.py) and influence
+# diagnostics (diagnostics.py) are both built on this pass.
+
+def iter_residuals_and_leverage(X_raw, y, beta, L, chunk_rows=100_000):
+    """
+    Yield (start, residuals, leverage) per block of rows, for the fit β
+    whose XᵀX = LLᵀ (intercept first). X_raw WITHOUT the ones column.
+    """
+    for start in range(0, X_raw.shape[0], chunk_rows):
+        X_block = with_intercept(X_raw[start:start + chunk_rows])
+        residuals = np.asarray(y[start:start + chunk_rows], dtype=np.float64) - X_block @ beta
+        W = solve_triangular(L, X_block.T, lower=True)       # (p x chunk) = L⁻¹ x_i for each row
+        yield start, residuals, np.einsum("ij,ij->j", W, W)
+
+
+# ---------------------------------------------------------------------------
+# Step 2: solve XᵀX β = Xᵀy WITHOUT inverting
+# ---------------------------------------------------------------------------
+# np.linalg.inv(XtX) @ Xty does more work than needed AND is less accurate.
+# XᵀX is symmetric positive definite, so Cholesky (XᵀX = LLᵀ) is the natural
+# factorization: ~p³/3 flops, then two cheap triangular solves.
+
+def solve_gram(XtX, Xty):
+    """Solve (XᵀX) β = Xᵀy with a Cholesky factorization."""
+    try:
+        c_and_lower = cho_factor(XtX)
+    except np.linalg.LinAlgError:
+        raise np.linalg.LinAlgError(
+            "XᵀX is not positive definite — features are (nearly) collinear. "
+            "Drop duplicate columns or add a ridge penalty."
+        ) from None
+    return cho_solve(c_and_lower, Xty)
+
+
+# ---------------------------------------------------------------------------
+# Alternative: TSQR (Tall-Skinny QR), streamed
+# ---------------------------------------------------------------------------
+# Forming XᵀX squares the condition number: κ(XᵀX) = κ(X)².
+# If your features are badly scaled or nearly collinear, that hurts.
+#
+# QR avoids it. If X = QR then β solves  R β = Qᵀy.
+# We never need Q itself — just R (p x p) and Qᵀy (p x 1). And those can be
+# updated one block at a time: stack the current R on top of the next block
+# and re-QR the small (p + chunk) x p matrix.
+
+def accumulate_tsqr(blocks, fit_intercept=True):
+    """One pass over the blocks. Returns (R, Qty) for X = QR."""
+    R = None
+    Qty = None
+
+    for X_block, y_block in blocks:
+        X_block = with_intercept(X_block) if fit_intercept else np.asarray(X_block, dtype=np.float64)
+        y_block = np.asarray(y_block, dtype=np.float64)
+
+        if R is not None:
+            X_block = np.vstack([R, X_block])
+            y_block = np.concatenate([Qty, y_block])
+
+        Q_b, R = np.linalg.qr(X_block, mode="reduced")
+        Qty = Q_b.T @ y_block
+
+    if R is None:
+        raise ValueError("No data: the block iterator was empty")
+    return R, Qty
+
+
+def streaming_normal_equation(blocks, fit_intercept=True, method="cholesky"):
+    """
+    Fit linear regression from an iterable of (X_block, y_block).
+
+    method="cholesky": accumulate XᵀX, Xᵀy, then Cholesky solve (fastest)
+    method="tsqr":     streaming QR of X (better conditioned, ~2x the flops)
+    """
+    if method == "cholesky":
+        XtX, Xty, _, _ = accumulate_gram(blocks, fit_intercept=fit_intercept)
+        return solve_gram(XtX, Xty)
+    if method == "tsqr":
+        R, Qty = accumulate_tsqr(blocks, fit_intercept=fit_intercept)
+        return solve_triangular(R, Qty, lower=False)
+    raise ValueError(f"Unknown method {method!r}; use 'cholesky' or 'tsqr'")
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    # -----------------------------------------------------------------------
+    # Same relationship as example_numpy.py, but written to disk
+    # -----------------------------------------------------------------------
+    # True relationship: y = 3 + 2*x + noise
+
+    np.random.seed(42)
+    n_samples = 1_000_000
+
+    X_raw = 2 * np.random.rand(n_samples, 1)
+    y = 3 + 2 * X_raw[:, 0] + np.random.randn(n_samples) * 0.5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        X_path = os.path.join(tmp, "X.npy")
+        y_path = os.path.join(tmp, "y.npy")
+        np.save(X_path, X_raw)
+        np.save(y_path, y)
+
+        print("=== Streaming Normal Equation (Cholesky) ===")
+        start = time.perf_counter()
+        beta_chol = streaming_normal_equation(iter_npy_blocks(X_path, y_path, chunk_rows=100_000))
+        elapsed = time.perf_counter() - start
+        print(f"Intercept (β₀): {beta_chol[0]:.4f}  (true: 3.0)")
+        print(f"Slope     (β₁): {beta_chol[1]:.4f}  (true: 2.0)")
+        print(f"Time: {elapsed:.3f}s for {n_samples:,} rows in 100k-row chunks")
+
+        print("\n=== Streaming Normal Equation (TSQR) ===")
+        beta_qr = streaming_normal_equation(
+            iter_npy_blocks(X_path, y_path, chunk_rows=100_000), method="tsqr"
+        )
+        print(f"Intercept (β₀): {beta_qr[0]:.4f}  (true: 3.0)")
+        print(f"Slope     (β₁): {beta_qr[1]:.4f}  (true: 2.0)")
+
+    # -----------------------------------------------------------------------
+    # Sanity check: same answer as the in-memory Normal Equation
+    # -----------------------------------------------------------------------
+    X = np.column_stack([np.ones(n_samples), X_raw])
+    beta_in_memory = np.linalg.solve(X.T @ X, X.T @ y)
+
+    print("\n=== Comparison with in-memory solve ===")
+    print(f"Max |Cholesky - in-memory|: {np.max(np.abs(beta_chol - beta_in_memory)):.2e}")
+    print(f"Max |TSQR     - in-memory|: {np.max(np.abs(beta_qr - beta_in_memory)):.2e}")
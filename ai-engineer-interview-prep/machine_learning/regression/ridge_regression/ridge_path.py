@@ -0,0 +1,138 @@
+"""
+The Whole Ridge Path From One Eigendecomposition (NumPy)
+==========================================================
+Ridge regression minimizes  ||y - Xβ||² + λ||β||²  and has a closed form:
+
+    β(λ) = (XᵀX + λI)⁻¹ Xᵀy
+
+Sweeping 100 values of λ the naive way = 100 separate p x p solves.
+But XᵀX is symmetric, so decompose it ONCE:
+
+    XᵀX = V diag(d) Vᵀ        (eigenvectors V, eigenvalues d ≥ 0)
+
+Adding λI only shifts the eigenvalues (V doesn't change!), so:
+
+    β(λ) = V diag(1 / (d + λ)) Vᵀ Xᵀy
+
+After one O(p³) decomposition, each extra λ costs O(p²). That's the
+whole path for about the price of one fit.
+
+The intercept is NOT penalized: we center X and y, fit the slopes, then
+recover β₀ = ȳ - x̄ᵀβ. Shrinking the intercept toward 0 would just
+shift every prediction. ridge_path centers block by block as it reads
+the data (streaming_normal_equation.accumulate_centered_gram), so
+features with a large mean — timestamps, IDs, prices in cents — lose no
+precision.
+"""
+
+import runpy
+from pathlib import Path
+
+import numpy as np
+
+_streaming = runpy.run_path(str(Path(__file__).resolve().parents[1] / "linear_regression" / "streaming_normal_equation.py"))
+accumulate_centered_gram = _streaming["accumulate_centered_gram"]
+iter_array_blocks = _streaming["iter_array_blocks"]
+
+
+def ridge_path_from_centered(gram_c, xty_c, x_mean, y_mean, lambdas):
+    """
+    Ridge coefficients for every λ, from CENTERED statistics: X_cᵀX_c,
+    X_cᵀy_c and the means, as returned by accumulate_centered_gram.
+
+    Returns an array of shape (len(lambdas), p + 1): row k is
+    [β₀, β₁, ..., β_p] for lambdas[k].
+    """
+    lambdas = np.asarray(lambdas, dtype=np.float64)
+
+    # One eigendecomposition for the whole path
+    d, V = np.linalg.eigh(gram_c)
+    d = np.clip(d, 0.0, None)          # tiny negative values are round-off
+    rotated = V.T @ xty_c              # Xᵀy in the eigenbasis, O(p²) once
+
+    # (p, L): column k holds the slopes for lambdas[k]
+    slopes = V @ (rotated[:, None] / (d[:, None] + lambdas[None, :]))
+    intercepts = y_mean - x_mean @ slopes
+    return np.column_stack([intercepts, slopes.T])
+
+
+def ridge_path_from_gram(XtX, Xty, n, lambdas):
+    """
+    Ridge path from the UNCENTERED Gram matrix and Xᵀy of [1, X_raw]
+    (intercept column FIRST), e.g. from streaming_normal_equation.accumulate_gram.
+
+    Limitation: centering on these statistics, X_cᵀX_c = XᵀX - n·x̄x̄ᵀ,
+    cancels catastrophically when a feature's mean dwarfs its spread
+    (relative error ~ 1e-16·(x̄ / std)²). Prefer ridge_path, which never
+    forms XᵀX.
+    """
+    x_mean = XtX[0, 1:] / n
+    y_mean = Xty[0] / n
+    gram_c = XtX[1:, 1:] - n * np.outer(x_mean, x_mean)
+    xty_c = Xty[1:] - n * x_mean * y_mean
+    return ridge_path_from_centered(gram_c, xty_c, x_mean, y_mean, lambdas)
+
+
+def ridge_path(X_raw, y, lambdas, chunk_rows=100_000):
+    """
+    Ridge path in one chunked pass over the data — works with
+    np.load(..., mmap_mode="r") arrays. X_raw WITHOUT the ones column.
+    """
+    gram_c, xty_c, x_mean, y_mean, _ = accumulate_centered_gram(iter_array_blocks(X_raw, y, chunk_rows))
+    return ridge_path_from_centered(gram_c, xty_c, x_mean, y_mean, lambdas)
+
+
+if __name__ == "__main__":
+    import time
+
+    # -----------------------------------------------------------------------
+    # Correlated features: where ridge actually matters
+    # -----------------------------------------------------------------------
+    # y = 3 + 2*x₁ + 2*x₂ + ... with 50 features that share a common factor
+    rng = np.random.default_rng(42)
+    n, p = 2_000, 50
+    common = rng.standard_normal((n, 1))
+    X_raw = 0.9 * common + 0.3 * rng.standard_normal((n, p))
+    y = 3 + X_raw @ np.full(p, 2.0) + rng.standard_normal(n)
+
+    lambdas = np.logspace(-3, 4, 100)
+
+    start = time.perf_counter()
+    path = ridge_path(X_raw, y, lambdas)
+    t_path = time.perf_counter() - start
+
+    # Baseline: one independent solve per λ (sharing XᵀX, to be fair)
+    start = time.perf_counter()
+    X = np.column_stack([np.ones(n), X_raw])
+    penalty = np.eye(p + 1)
+    penalty[0, 0] = 0.0                # don't penalize the intercept
+    XtX, Xty = X.T @ X, X.T @ y
+    refits = np.array([np.linalg.solve(XtX + lam * penalty, Xty) for lam in lambdas])
+    t_refit = time.perf_counter() - start
+
+    print(f"=== Ridge Path: {len(lambdas)} values of λ, n={n:,}, p={p} ===")
+    print(f"One eigendecomposition: {t_path * 1000:7.1f} ms")
+    print(f"Independent refits:     {t_refit * 1000:7.1f} ms  ({t_refit / t_path:.0f}x slower)")
+    print(f"Max |path - refits|:    {np.max(np.abs(path - refits)):.2e}")
+
+    print(f"\n{'λ':>10s} | {'β₀':>8s} | {'mean βⱼ':>8s} | {'||β||':>8s}")
+    print("-" * 44)
+    for k in range(0, len(lambdas), 11):
+        print(f"{lambdas[k]:10.3f} | {path[k, 0]:8.4f} | {path[k, 1:].mean():8.4f} | "
+              f"{np.linalg.norm(path[k, 1:]):8.4f}")
+    print("(As λ grows, the slopes shrink toward 0 and β₀ moves toward ȳ.)")
+
+    # -----------------------------------------------------------------------
+    # Features with a large mean: centering XᵀX after the fact vs per block
+    # -----------------------------------------------------------------------
+    # Shift every feature by 1e6 (think: Unix timestamps). The true slopes
+    # don't change; only β₀ absorbs the shift.
+    offset = 1e6
+    X_shifted = X_raw + offset
+    X1 = np.column_stack([np.ones(n), X_shifted])
+    from_gram = ridge_path_from_gram(X1.T @ X1, X1.T @ y, n, lambdas)
+    chunked = ridge_path(X_shifted, y, lambdas, chunk_rows=500)
+
+    print(f"\n=== Features shifted by {offset:.0e}: max |slopes - unshifted slopes| ===")
+    print(f"XᵀX - n·x̄x̄ᵀ:           {np.max(np.abs(from_gram[:, 1:] - path[:, 1:])):.2e}")
+    print(f"Centered per block:     {np.max(np.abs(chunked[:, 1:] - path[:, 1:])):.2e}")
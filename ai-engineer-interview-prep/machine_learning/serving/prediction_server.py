@@ -0,0 +1,342 @@
+"""
+Serving Fitted Models: Artifacts, Micro-Batching, Latency
+===========================================================
+The examples predict inline: X @ beta. In production, thousands of
+callers each send ONE row and want an answer fast. Three pieces:
+
+  1. A model artifact that loads instantly
+       model_dir/meta.json   — model type, shapes, format version
+       model_dir/coef.npy    — coefficients, intercept FIRST (as in the examples)
+     np.load(..., mmap_mode="r") maps the file instead of reading it, so
+     loading is O(1) and many server processes share one copy in the OS
+     page cache.
+
+  2. Micro-batching. Scoring one row is a tiny dot product; the fixed
+     cost per request (syscalls, Python, waking a task) dwarfs it. So
+     requests that arrive together are stacked into one matrix and scored
+     with ONE GEMV/GEMM:
+       - take the first waiting request
+       - keep collecting until max_batch rows OR max_wait_ms has passed
+       - score the batch, answer everyone
+     max_wait_ms is the latency budget you spend to buy throughput.
+     max_wait_ms=0 still batches whatever is ALREADY queued — free wins.
+
+  3. Measurement: closed-loop clients, per-request latency, p50 / p99 and
+     rows/sec — the numbers you size a deployment with.
+
+Reading the benchmark: with 64 clients, batching whatever is queued
+(max_wait_ms=0) beats one-predict-per-request on BOTH throughput and p50.
+Waiting longer only pays when the server has idle cores and sparse
+traffic; when the CPU is already saturated (or shared with the clients,
+as in the demo) every waited millisecond is pure added latency. Size with
+your own traffic: rows/sec per process at your p99 target.
+
+Wire protocol (localhost TCP, fixed-size frames, no parsing):
+    request:  n_features float64 values (little-endian), one row
+    response: n_outputs float64 values
+
+Usage:
+    python prediction_server.py bench                       # demo: temp model, load test
+    python prediction_server.py serve MODEL_DIR --port 8765 --max-wait-ms 1
+    python prediction_server.py bench MODEL_DIR --clients 64 --requests 500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+FORMAT_VERSION = 1
+MODELS = ("linear", "logistic", "softmax")
+
+
+# ---------------------------------------------------------------------------
+# Part 1: the model artifact
+# ---------------------------------------------------------------------------
+
+def save_model(path, coef, model="linear"):
+    """
+    Write a model artifact directory.
+
+    coef: intercept FIRST — shape (p + 1,) for linear / logistic (β from the
+    example_numpy.py files), (p + 1, K) for softmax (W from
+    softmax_regression.py).
+    """
+    if model not in MODELS:
+        raise ValueError(f"model must be one of {MODELS}, got {model!r}")
+    coef = np.ascontiguousarray(coef, dtype=np.float64)
+    if coef.ndim != (2 if model == "softmax" else 1):
+        raise ValueError(f"{model} coefficients must be {'2-D' if model == 'softmax' else '1-D'}, got {coef.shape}")
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    np.save(path / "coef.npy", coef)
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "model": model,
+        "n_features": coef.shape[0] - 1,
+        "n_outputs": coef.shape[1] if coef.ndim == 2 else 1,
+        "dtype": "float64",
+    }
+    # meta.json last, via rename: a reader never sees a half-written artifact
+    tmp = path / "meta.json.tmp"
+    tmp.write_text(json.dumps(meta, indent=2))
+    os.replace(tmp, path / "meta.json")
+
+
+class LoadedModel:
+    """A model artifact, memory-mapped. predict() takes X_raw (no ones column)."""
+
+    def __init__(self, path, mmap=True):
+        path = Path(path)
+        self.meta = json.loads((path / "meta.json").read_text())
+        if self.meta["format_version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported artifact format {self.meta['format_version']} (expected {FORMAT_VERSION})")
+        self.coef = np.load(path / "coef.npy", mmap_mode="r" if mmap else None)
+        if self.coef.shape[0] != self.meta["n_features"] + 1:
+            raise ValueError(f"coef.npy has shape {self.coef.shape}, meta.json says {self.meta['n_features']} features")
+        self.model = self.meta["model"]
+        self.n_features = self.meta["n_features"]
+        self.n_outputs = self.meta["n_outputs"]
+
+    def predict(self, X_raw):
+        """(m, n_features) → (m,) for linear / logistic, (m, K) for softmax."""
+        z = X_raw @ self.coef[1:] + self.coef[0]              # one GEMV (or GEMM) per batch
+        if self.model == "linear":
+            return z
+        if self.model == "logistic":
+            return 0.5 * (1.0 + np.tanh(0.5 * z))
+        z -= z.max(axis=1, keepdims=True)
+        np.exp(z, out=z)
+        z /= z.sum(axis=1, keepdims=True)
+        return z
+
+
+# ---------------------------------------------------------------------------
+# Part 2: micro-batching
+# ---------------------------------------------------------------------------
+
+class MicroBatcher:
+    """Collects concurrent single-row requests into batches for one predict() call."""
+
+    def __init__(self, model, max_batch=256, max_wait_ms=1.0):
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.queue = asyncio.Queue()
+        self.n_batches = 0
+        self.n_rows = 0
+
+    async def predict(self, row):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((row, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch:
+                # Take everything already queued for free; wait only within budget
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            X = np.stack([row for row, _ in batch])
+            try:
+                outputs = self.model.predict(X)
+            except Exception as exc:                           # fail the batch, keep serving
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+            for (_, future), output in zip(batch, outputs):
+                future.set_result(output)
+            self.n_batches += 1
+            self.n_rows += len(batch)
+
+
+async def serve(model, host="127.0.0.1", port=8765, max_batch=256, max_wait_ms=1.0, ready=None):
+    """Serve `model` until cancelled or SIGTERM. Prints batch stats as JSON on exit."""
+    batcher = MicroBatcher(model, max_batch, max_wait_ms)
+    request_bytes = 8 * model.n_features
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                row = np.frombuffer(await reader.readexactly(request_bytes), dtype="<f8")
+                output = await batcher.predict(row)
+                writer.write(np.asarray(output, dtype="<f8").tobytes())
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass                                               # client hung up
+        except Exception as exc:                               # the batch failed: no frame to send
+            print(f"predict failed, closing connection: {exc!r}", file=sys.stderr, flush=True)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    worker = asyncio.create_task(batcher.run())
+    server = await asyncio.start_server(handle, host, port)
+    stop = asyncio.Event()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    if ready is not None:
+        ready()
+    try:
+        await stop.wait()
+    finally:
+        server.close()
+        worker.cancel()
+        print(json.dumps({"batches": batcher.n_batches, "rows": batcher.n_rows,
+                          "mean_batch": batcher.n_rows / max(batcher.n_batches, 1)}), flush=True)
+
+
+# ---------------------------------------------------------------------------
+# Part 3: the load generator
+# ---------------------------------------------------------------------------
+
+async def load_test(host, port, n_features, n_outputs, clients=32, requests_per_client=300, seed=0):
+    """
+    Closed loop: each client sends one row, waits for the answer, repeats.
+    Returns per-request latencies (seconds), total wall time, and the rows
+    sent with the responses received — (clients * requests, n_features) and
+    (clients * requests, n_outputs), in matching order.
+    """
+    rng = np.random.default_rng(seed)
+    rows = rng.standard_normal((clients, requests_per_client, n_features)).astype("<f8")
+    responses = np.empty((clients, requests_per_client, n_outputs))
+    latencies = np.empty((clients, requests_per_client))
+    response_bytes = 8 * n_outputs
+
+    async def client(c):
+        reader, writer = await asyncio.open_connection(host, port)
+        for i in range(requests_per_client):
+            start = time.perf_counter()
+            writer.write(rows[c, i].tobytes())
+            frame = await reader.readexactly(response_bytes)
+            latencies[c, i] = time.perf_counter() - start
+            responses[c, i] = np.frombuffer(frame, dtype="<f8")
+        writer.close()
+        await writer.wait_closed()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(c) for c in range(clients)))
+    wall = time.perf_counter() - start
+    return latencies.ravel(), wall, rows.reshape(-1, n_features), responses.reshape(-1, n_outputs)
+
+
+def _bench(model_dir, port, clients, requests, settings):
+    """Run the server in a subprocess per setting; load-test it from here."""
+    model = LoadedModel(model_dir)
+    print(f"=== {model.model} model, {model.n_features} features | "
+          f"{clients} concurrent clients x {requests} requests ===")
+    print(f"{'max_batch':>9s} {'max_wait':>8s} | {'p50':>8s} {'p99':>8s} | {'rows/sec':>9s} | "
+          f"{'mean batch':>10s} | {'max |Δ|':>7s}")
+
+    for max_batch, max_wait_ms in settings:
+        server = subprocess.Popen(
+            [sys.executable, __file__, "serve", str(model_dir), "--port", str(port),
+             "--max-batch", str(max_batch), "--max-wait-ms", str(max_wait_ms)],
+            stdout=subprocess.PIPE, text=True,
+        )
+        try:
+            if server.stdout.readline().strip() != "ready":
+                raise RuntimeError(f"Server failed to start on port {port} (already in use?)")
+            latencies, wall, rows, responses = asyncio.run(
+                load_test("127.0.0.1", port, model.n_features, model.n_outputs, clients, requests))
+        except BaseException:
+            server.kill()
+            server.wait()
+            raise
+        server.send_signal(signal.SIGTERM)
+        stats = json.loads(server.communicate(timeout=30)[0].strip().splitlines()[-1])
+        # Every answer went through framing, byte order and per-future routing:
+        # it must match predicting the same rows in-process
+        error = np.max(np.abs(responses - model.predict(rows).reshape(len(rows), -1)))
+        if not error <= 1e-12:
+            raise RuntimeError(f"Served predictions differ from model.predict by {error:.1e}")
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        print(f"{max_batch:9d} {max_wait_ms:6.1f}ms | {p50:6.2f}ms {p99:6.2f}ms | "
+              f"{len(latencies) / wall:9,.0f} | {stats['mean_batch']:10.1f} | {error:7.1e}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve_cmd = sub.add_parser("serve", help="serve a model artifact on localhost")
+    serve_cmd.add_argument("model_dir")
+    serve_cmd.add_argument("--port", type=int, default=8765)
+    serve_cmd.add_argument("--max-batch", type=int, default=256)
+    serve_cmd.add_argument("--max-wait-ms", type=float, default=1.0)
+
+    bench_cmd = sub.add_parser("bench", help="load-test the server (default: a temp demo model)")
+    bench_cmd.add_argument("model_dir", nargs="?")
+    bench_cmd.add_argument("--port", type=int, default=8765)
+    bench_cmd.add_argument("--clients", type=int, default=64)
+    bench_cmd.add_argument("--requests", type=int, default=200, help="requests per client")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        model = LoadedModel(args.model_dir)
+        asyncio.run(serve(model, port=args.port, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms,
+                          ready=lambda: print("ready", flush=True)))
+        return 0
+
+    # max_batch=1 is "no batching": one predict() per request
+    settings = [(1, 0.0), (256, 0.0), (256, 1.0), (256, 5.0)]
+    if args.model_dir:
+        _bench(args.model_dir, args.port, args.clients, args.requests, settings)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rng = np.random.default_rng(42)
+
+        # 1) Load time: a big softmax model (100k features x 100 classes, 80 MB)
+        big_dir = Path(tmp) / "softmax_big"
+        save_model(big_dir, rng.standard_normal((100_001, 100)), model="softmax")
+        timings = {}
+        for mmap in (False, True):
+            start = time.perf_counter()
+            LoadedModel(big_dir, mmap=mmap)
+            timings[mmap] = time.perf_counter() - start
+        print("=== Loading an 80 MB softmax artifact ===")
+        print(f"np.load (read everything): {timings[False] * 1000:8.2f} ms")
+        print(f"np.load(mmap_mode='r'):    {timings[True] * 1000:8.2f} ms  (pages fault in on first use)\n")
+
+        # 2) Correctness + load test: a logistic model with 100 features,
+        #    like a fitted example_numpy β
+        beta = rng.standard_normal(101) * 0.1
+        model_dir = Path(tmp) / "logistic_demo"
+        save_model(model_dir, beta, model="logistic")
+        X_raw = rng.standard_normal((1000, 100))
+        expected = 1 / (1 + np.exp(-(X_raw @ beta[1:] + beta[0])))
+        print(f"Saved artifact vs inline sigmoid(Xβ): "
+              f"max |Δ| = {np.max(np.abs(LoadedModel(model_dir).predict(X_raw) - expected)):.1e}")
+        print("(max |Δ| below: each served response vs model.predict on the same rows)\n")
+
+        _bench(model_dir, args.port, args.clients, args.requests, settings)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())